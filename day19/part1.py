@@ -1,78 +1,46 @@
-from collections.abc import Callable
-from dataclasses import dataclass
+from lib import DecisionTable
+from lib import Rule
 
 
-type Rating = dict[str, int]
+CATEGORIES = "xmas"
 
-
-@dataclass
-class Rule:
-    target: str
-    condition: Callable[[Rating], bool] = lambda _: True
-
-
-@dataclass(frozen=True)
-class Workflow:
-    name: str
-    rules: list[Rule]
+type Rating = tuple[int, ...]
 
 
 def solution(s: str) -> int:
     w_s, r_s = s.split("\n\n")
-    workflows = parse_workflows(w_s)
-    ratings = parse_ratings(r_s)
-    total = 0
-    for rating in ratings:
-        if is_accepted(rating, workflows):
-            total += sum(rating.values())
-    return total
-
+    table = DecisionTable.compile(parse_workflows(w_s), "in")
+    return sum(sum(rating) for rating in parse_ratings(r_s) if table.evaluate(rating) == "A")
 
-def is_accepted(rating: Rating, workflows: dict[str, Workflow]) -> bool:
-    w = "in"
-    while True:
-        if w == "A":
-            return True
-        elif w == "R":
-            return False
 
-        for rule in workflows[w].rules:
-            if rule.condition(rating):
-                w = rule.target
-                break
+def parse_workflows(s: str) -> dict[str, tuple[list[Rule], str]]:
+    return dict(map(parse_workflow, s.splitlines()))
 
 
-def parse_workflows(s: str) -> dict[str, Workflow]:
-    return {w.name: w for w in map(parse_workflow, s.splitlines())}
-
-
-def parse_workflow(s: str) -> Workflow:
+def parse_workflow(s: str) -> tuple[str, tuple[list[Rule], str]]:
     name, rest = s.split("{")
-    rules_s = rest.strip("}")
-    rules = [parse_rule(s) for s in rules_s.split(",")]
-    return Workflow(name, rules)
+    *rules_s, fallback = rest.strip("}").split(",")
+    return name, ([parse_rule(s) for s in rules_s], fallback)
 
 
 def parse_rule(s: str) -> Rule:
-    cond_or_target, colon, target = s.partition(":")
-    if not colon:
-        return Rule(cond_or_target)
-
-    cond = cond_or_target
+    cond, _, target = s.partition(":")
     if ">" in cond:
         key, _, value_s = cond.partition(">")
-        value = int(value_s)
-        return Rule(target, lambda rating: rating[key] > value)
+        return CATEGORIES.index(key), ">", int(value_s), target
     if "<" in cond:
         key, _, value_s = cond.partition("<")
-        value = int(value_s)
-        return Rule(target, lambda rating: rating[key] < value)
+        return CATEGORIES.index(key), "<", int(value_s), target
     else:
         raise ValueError(f"Unexpected rule string: {s}")
 
 
 def parse_ratings(s: str) -> list[Rating]:
-    return [eval(f"dict({l[1:-1]})") for l in s.splitlines()]
+    ratings = []
+    for line in s.splitlines():
+        values = dict(item.split("=") for item in line[1:-1].split(","))
+        ratings.append(tuple(int(values[key]) for key in CATEGORIES))
+    return ratings
 
 
 class Test:
@@ -1,154 +1,40 @@
-from collections.abc import Callable
-from dataclasses import dataclass
-from functools import partial
-from typing import Self
+from lib import Box
+from lib import DecisionTable
+from lib import Rule
 
 
-@dataclass
-class Range:
-    start: int
-    end: int
-
-    @property
-    def length(self) -> int:
-        return self.end - self.start + 1
-
-    @classmethod
-    def empty(cls) -> Self:
-        return Range(0, -1)
-
-    @classmethod
-    def full(cls) -> Self:
-        return Range(1, 4000)
-
-    @property
-    def is_empty(self) -> bool:
-        return self.end < self.start
-
-    def __bool__(self) -> bool:
-        return not self.is_empty
-
-
-@dataclass
-class RatingRange:
-    x: Range
-    m: Range
-    a: Range
-    s: Range
-
-    @classmethod
-    def empty(cls) -> Self:
-        return cls(Range.empty(), Range.empty(), Range.empty(), Range.empty())
-
-    @classmethod
-    def full(cls) -> Self:
-        return cls(Range.full(), Range.full(), Range.full(), Range.full())
-
-    def combinations(self) -> int:
-        return self.x.length * self.m.length * self.a.length * self.s.length
-
-
-@dataclass
-class Rule:
-    target: str
-    condition: Callable[[RatingRange], tuple[RatingRange, RatingRange]] = lambda rr: (
-        rr,
-        RatingRange.empty(),
-    )
-
-
-@dataclass(frozen=True)
-class Workflow:
-    name: str
-    rules: list[Rule]
+CATEGORIES = "xmas"
 
 
 def solution(s: str) -> int:
     w_s, _ = s.split("\n\n")
-    workflows = parse_workflows(w_s)
-
-    queue: list[tuple[str, RatingRange]] = [("in", RatingRange.full())]
-    accepted_ranges: list[RatingRange] = []
-    while queue:
-        w, rr = queue.pop()
-        if w == "A":
-            accepted_ranges.append(rr)
-            continue
-
-        if w == "R":
-            continue
-
-        for rule in workflows[w].rules:
-            trr, rr = rule.condition(rr)
-            if trr:
-                queue.append((rule.target, trr))
-            if not rr:
-                break
+    table = DecisionTable.compile(parse_workflows(w_s), "in")
+    ratings = Box([(1, 4001)] * len(CATEGORIES))
+    return sum(box.volume for box in table.partition(ratings)["A"])
 
-    return sum(rr.combinations() for rr in accepted_ranges)
 
+def parse_workflows(s: str) -> dict[str, tuple[list[Rule], str]]:
+    return dict(map(parse_workflow, s.splitlines()))
 
-def parse_workflows(s: str) -> dict[str, Workflow]:
-    return {w.name: w for w in map(parse_workflow, s.splitlines())}
 
-
-def parse_workflow(s: str) -> Workflow:
+def parse_workflow(s: str) -> tuple[str, tuple[list[Rule], str]]:
     name, rest = s.split("{")
-    rules_s = rest.strip("}")
-    rules = [parse_rule(s) for s in rules_s.split(",")]
-    return Workflow(name, rules)
+    *rules_s, fallback = rest.strip("}").split(",")
+    return name, ([parse_rule(s) for s in rules_s], fallback)
 
 
 def parse_rule(s: str) -> Rule:
-    cond_or_target, colon, target = s.partition(":")
-    if not colon:
-        return Rule(cond_or_target)
-
-    cond = cond_or_target
+    cond, _, target = s.partition(":")
     if ">" in cond:
         key, _, value_s = cond.partition(">")
-        value = int(value_s)
-        return Rule(target, partial(split_range_gt, key=key, value=value))
+        return CATEGORIES.index(key), ">", int(value_s), target
     if "<" in cond:
         key, _, value_s = cond.partition("<")
-        value = int(value_s)
-        return Rule(target, partial(split_range_lt, key=key, value=value))
+        return CATEGORIES.index(key), "<", int(value_s), target
     else:
         raise ValueError(f"Unexpected rule string: {s}")
 
 
-def split_range_lt(
-    rr: RatingRange, key: str, value: int
-) -> tuple[RatingRange, RatingRange]:
-    rrd = {k: getattr(rr, k) for k in ("x", "m", "a", "s")}
-    kr = rrd[key]
-    if kr.end < value:
-        return rr, RatingRange.empty()
-    if kr.start > value:
-        return RatingRange.empty(), rr
-
-    return (
-        RatingRange(**(rrd | {key: Range(kr.start, value - 1)})),
-        RatingRange(**(rrd | {key: Range(value, kr.end)})),
-    )
-
-
-def split_range_gt(
-    rr: RatingRange, key: str, value: int
-) -> tuple[RatingRange, RatingRange]:
-    rrd = {k: getattr(rr, k) for k in ("x", "m", "a", "s")}
-    kr = rrd[key]
-    if kr.end < value:
-        return RatingRange.empty(), rr
-    if kr.start > value:
-        return rr, RatingRange.empty()
-
-    return (
-        RatingRange(**(rrd | {key: Range(value + 1, kr.end)})),
-        RatingRange(**(rrd | {key: Range(kr.start, value)})),
-    )
-
-
 class Test:
     import pytest
 
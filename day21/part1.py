@@ -1,11 +1,13 @@
 from collections.abc import Iterator
 
-from lib import FrozenGrid
-from lib import Point
+from lib import FlatGrid
+
+
+ROCK = ord("#")
 
 
 def solution(s: str, steps: int = 64) -> int:
-    grid = FrozenGrid.from_str(s)
+    grid = FlatGrid.from_str(s, sentinel="#")
     locations = {grid.find("S")}
     for _ in range(steps):
         locations = {sp for l in locations for sp in get_steps(l, grid)}
@@ -13,14 +15,11 @@ def solution(s: str, steps: int = 64) -> int:
     return len(locations)
 
 
-def get_steps(l: Point, grid: FrozenGrid) -> Iterator[Point]:
-    for n in l.iter_neighbors(diagonals=False):
-        try:
-            c = grid[n.y][n.x]
-        except IndexError:
-            continue
-
-        if c != "#":
+def get_steps(l: int, grid: FlatGrid) -> Iterator[int]:
+    cells = grid.cells
+    for offset in grid.offsets4:
+        n = l + offset
+        if cells[n] != ROCK:
             yield n
 
 
@@ -12,18 +12,19 @@ Thought:
 import math
 from collections.abc import Iterator
 
-from lib import FrozenGrid
+from lib import FlatGrid
 from lib import Point
 
 
-type GridWalk = list[set[Point]]
+type GridWalk = list[set[int]]
+ROCK = ord("#")
 
 
 def solution(s: str, steps: int = 26501365) -> int:
-    grid = FrozenGrid.from_str(s)
+    grid = FlatGrid.from_str(s, sentinel="#")
     assert grid.row_len() == grid.col_len()
 
-    sp = grid.find("S")
+    sp = grid.point(grid.find("S"))
     max_xy = grid.row_len() - 1
 
     total = 0
@@ -47,12 +48,12 @@ def solution(s: str, steps: int = 26501365) -> int:
     return total
 
 
-def calc_center(sp: Point, grid: FrozenGrid, steps: int) -> int:
+def calc_center(sp: Point, grid: FlatGrid, steps: int) -> int:
     gw = walk_grid(sp, grid)
     return get_gw_total(gw, steps)
 
 
-def calc_side(sp: Point, grid: FrozenGrid, steps: int, side: Point) -> int:
+def calc_side(sp: Point, grid: FlatGrid, steps: int, side: Point) -> int:
     if steps <= sp.x:
         return 0
 
@@ -76,7 +77,7 @@ def calc_side(sp: Point, grid: FrozenGrid, steps: int, side: Point) -> int:
     return total
 
 
-def calc_angle(sp: Point, grid: FrozenGrid, steps: int, angle: Point) -> int:
+def calc_angle(sp: Point, grid: FlatGrid, steps: int, angle: Point) -> int:
     steps_to_escape_center = sp.x + sp.y + 2
     if steps < steps_to_escape_center:
         return 0
@@ -124,10 +125,10 @@ def get_gw_even_max(gw: GridWalk) -> int:
     return sum(len(x) for x in gw[::2])
 
 
-def walk_grid(sp: Point, grid: FrozenGrid) -> GridWalk:
-    visited: set[Point] = set()
+def walk_grid(sp: Point, grid: FlatGrid) -> GridWalk:
+    visited: set[int] = set()
     gw: GridWalk = []
-    edge: set[Point] = {sp}
+    edge: set[int] = {grid.index(sp)}
     while edge:
         visited |= edge
         gw.append(edge)
@@ -136,10 +137,9 @@ def walk_grid(sp: Point, grid: FrozenGrid) -> GridWalk:
     return gw
 
 
-def get_steps(l: Point, grid: FrozenGrid, visited: set[Point]) -> Iterator[Point]:
-    for n in l.iter_neighbors(diagonals=False):
-        if n in visited or not grid.in_bounds(n):
-            continue
-
-        if grid[n.y][n.x] != "#":
+def get_steps(l: int, grid: FlatGrid, visited: set[int]) -> Iterator[int]:
+    cells = grid.cells
+    for offset in grid.offsets4:
+        n = l + offset
+        if n not in visited and cells[n] != ROCK:
             yield n
@@ -1,100 +1,20 @@
-from collections import defaultdict
-from collections.abc import Iterator
-from dataclasses import dataclass
-from typing import NamedTuple
-from typing import Self
-
 from lib import collect_lines
+from lib import dominated_counts
+from lib import settle_bricks
 
 
-class Vec2(NamedTuple):
-    x: int
-    y: int
-
-
-class Vec3(NamedTuple):
-    x: int
-    y: int
-    z: int
-
-    @property
-    def xy(self) -> Vec2:
-        return Vec2(self.x, self.y)
-
-    @classmethod
-    def from_str(cls, s: str) -> Self:
-        return cls(*map(int, s.split(",")))
-
-
-@dataclass
-class Brick:
-    head: Vec3
-    tail: Vec3
-
-    def iter_xy(self) -> Iterator[Vec2]:
-        assert self.head.x <= self.tail.x
-        assert self.head.y <= self.tail.y
-        for x in range(self.head.x, self.tail.x + 1):
-            for y in range(self.head.y, self.tail.y + 1):
-                yield Vec2(x, y)
-
-    def height(self) -> int:
-        assert self.head.z <= self.tail.z
-        return self.tail.z - self.head.z + 1
-
-    @classmethod
-    def from_str(cls, s: str) -> Self:
-        h_s, t_s = s.split("~")
-        return cls(Vec3.from_str(h_s), Vec3.from_str(t_s))
+def parse_brick(s: str) -> list[int]:
+    head, tail = s.split("~")
+    return [*map(int, head.split(",")), *map(int, tail.split(","))]
 
 
 def solution(s: str) -> int:
-    bricks = collect_lines(s, Brick.from_str)
-    bricks.sort(key=lambda b: b.head.z)
-
-    important: set[int] = set()
-    supports: dict[int, set[int]] = defaultdict(set)
-    supported_by: dict[int, set[int]] = defaultdict(set)
-    topography: dict[Vec2, tuple[int, int | None]] = defaultdict(lambda: (0, None))
-    for bid, b in enumerate(bricks):
-        z_to_bids: dict[int, set[int]] = defaultdict(set)
-        for xy in b.iter_xy():
-            z, obid = topography[xy]
-            if obid is not None:
-                z_to_bids[z].add(obid)
-
-        max_z = max(z_to_bids or [0])
-        max_z_bids = z_to_bids[max_z]
-
-        supported_by[bid] = max_z_bids
-        for max_z_bid in max_z_bids:
-            supports[max_z_bid].add(bid)
-
-        if len(max_z_bids) == 1:
-            (max_z_bid,) = max_z_bids
-            important.add(max_z_bid)
-
-        for xy in b.iter_xy():
-            topography[xy] = (max_z + b.height(), bid)
-
-    return sum(map(lambda bid: compute(bid, supports, supported_by), important))
-
-
-def compute(
-    sbid: int, supports: dict[int, set[int]], supported_by: dict[int, set[int]]
-) -> int:
-    dropped = set()
-    queue = {sbid}
-    while queue:
-        dropped |= queue
-
-        check = set()
-        for bid in queue:
-            check |= supports[bid]
-
-        queue = {bid for bid in check if supported_by[bid] <= dropped}
+    bricks = collect_lines(s, parse_brick)
+    bricks.sort(key=lambda b: b[2])
 
-    return len(dropped) - 1
+    # bricks settle in order, so bricks are only supported by earlier ones
+    settled = settle_bricks(bricks)
+    return sum(dominated_counts(settled.predecessors()))
 
 
 class Test:
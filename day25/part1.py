@@ -1,64 +1,51 @@
 """
-https://en.wikipedia.org/wiki/Karger%27s_algorithm
+The three wires form the global minimum cut. Any node on the far side of
+it, together with any node on the near side, has exactly that cut as its
+minimum s-t cut, so try sinks from the farthest node inward until a cut
+of size 3 turns up. A source or sink with exactly 3 wires also has a
+minimum s-t cut of size 3, its own wires, so cuts splitting off a single
+node are skipped.
 """
-import math
-from collections import defaultdict
-from random import Random
+from collections import deque
 
+from lib import min_st_cut
 
-rng = Random("aoc2023")
+
+CUT_SIZE = 3
 
 
 def solution(s: str) -> int:
-    edges: set[frozenset[str]] = set()
-    graph: dict[str, set[str]] = defaultdict(set)
+    ids: dict[str, int] = {}
+    wires = []
     for line in s.splitlines():
         key, value_s = line.split(": ")
-        for value in value_s.strip().split():
-            edges.add(frozenset({key, value}))
-            graph[key].add(value)
-            graph[value].add(key)
-
-    while True:
-        cg = contract(graph)
-        cut_size = len(next(iter(cg.values())))
-        if cut_size == 3:
-            return math.prod(map(lambda s: s.count("-") + 1, cg))
-
-
-def contract(g: dict[str, set[str]]) -> dict[str, list[str]]:
-    graph = {k: list(values) for k, values in g.items()}
-
-    for _ in range(len(graph) - 2):
-        n1, n2 = random_edge(graph)
-        new = f"{n1}-{n2}"
-
-        new_values = []
-        for n in graph.pop(n1):
-            if n == n2:
-                continue
-            new_values.append(n)
-            graph[n].remove(n1)
-            graph[n].append(new)
-
-        for n in graph.pop(n2):
-            if n == n1:
-                continue
-            new_values.append(n)
-            graph[n].remove(n2)
-            graph[n].append(new)
-
-        graph[new] = new_values
+        for value in value_s.split():
+            wires.append((ids.setdefault(key, len(ids)), ids.setdefault(value, len(ids))))
 
-    return graph
+    edges: list[list[tuple[int, int]]] = [[] for _ in ids]
+    for a, b in wires:
+        edges[a].append((b, 1))
+        edges[b].append((a, 1))
 
+    for sink in reversed(bfs_order(edges, 0)):
+        cut = min_st_cut(edges, 0, sink)
+        if cut.weight == CUT_SIZE and 1 < len(cut.side) < len(edges) - 1:
+            return len(cut.side) * (len(edges) - len(cut.side))
 
-def edges(graph: dict[str, list[str]]) -> list[tuple[str, str]]:
-    return [(k, v) for k, vs in graph.items() for v in vs]
+    raise AssertionError("no cut of size 3 found")
 
 
-def random_edge(graph: dict[str, list[str]]) -> tuple[str, str]:
-    return rng.choice(list(edges(graph)))
+def bfs_order(edges: list[list[tuple[int, int]]], start: int) -> list[int]:
+    order = [start]
+    seen = {start}
+    queue = deque([start])
+    while queue:
+        for n, _ in edges[queue.popleft()]:
+            if n not in seen:
+                seen.add(n)
+                order.append(n)
+                queue.append(n)
+    return order
 
 
 class Test:
@@ -85,6 +72,26 @@ frs: qnr lhk lsr
         ("case", "expected"),
         [
             (EXAMPLE_INPUT, EXPECTED_RESULT),
+            # zzz has 3 wires and is the farthest node from a000
+            (
+                """\
+a000: a111 a222 a333 a444 b000
+a111: a222 a333 a444 b111
+a222: a333 a444 b222
+a333: a444 c000 c111
+b000: b111 b222 b333 b444
+b111: b222 b333 b444
+b222: b333 b444
+b333: b444
+c000: c111 c222 c333 c444
+c111: c222 c333 c444
+c222: c333 c444
+c333: c444
+a444: c222 c333 c444
+zzz: c000 c111 c222
+""",
+                55,
+            ),
         ],
     )
     def test_examples(self, case, expected):
@@ -1,2 +1,9 @@
+from .beams import *
+from .bricks import *
+from .crucibles import *
+from .cycles import *
+from .graph import *
+from .grid import *
+from .intervals import *
 from .math import *
 from .parser import *
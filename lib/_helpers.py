@@ -70,6 +70,10 @@ class DayPart(NamedTuple):
     def solutionfile(self) -> Path:
         return self.outdir / f"solution{self.part}.txt"
 
+    @property
+    def profilefile(self) -> Path:
+        return self.outdir / f"profile{self.part}.prof"
+
     @property
     def promptfile(self) -> Path:
         return self.outdir / "prompt.md"
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import subprocess
+from collections.abc import Iterator
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import datetime
+from datetime import UTC
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from ._helpers import DayPart
+from ._helpers import get_rootdir
+from ._helpers import HandledError
+
+if TYPE_CHECKING:
+    from .run import PeakMemory
+
+
+HISTORY_FILENAME = ".run_history.jsonl"
+
+
+@dataclass(frozen=True)
+class Record:
+    day: int
+    part: int
+    commit: str
+    dirty: bool
+    python: str
+    samples: list[int]
+    timestamp: str = field(default_factory=lambda: datetime.now(UTC).isoformat())
+    peak_rss: int | None = None
+    peak_traced: int | None = None
+
+    @property
+    def daypart(self) -> DayPart:
+        return DayPart(self.day, self.part)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @classmethod
+    def create(
+        cls,
+        dp: DayPart,
+        samples: list[int],
+        peak_memory: PeakMemory | None = None,
+        *,
+        commit: str | None = None,
+        dirty: bool | None = None,
+    ) -> Record:
+        """
+        Pass the `commit` and `dirty` state when creating many records, to
+        look them up once rather than running git for each record.
+        """
+        return cls(
+            day=dp.day,
+            part=dp.part,
+            commit=get_commit() if commit is None else commit,
+            dirty=is_dirty() if dirty is None else dirty,
+            python=get_python_version(),
+            samples=samples,
+            peak_rss=peak_memory.rss if peak_memory else None,
+            peak_traced=peak_memory.traced if peak_memory else None,
+        )
+
+
+@dataclass(frozen=True)
+class Comparison:
+    dp: DayPart
+    ref: str
+    median: float
+    baseline: float | None
+    threshold: float
+
+    @property
+    def change(self) -> float | None:
+        if not self.baseline:
+            return None
+        return self.median / self.baseline - 1
+
+    @property
+    def regressed(self) -> bool:
+        change = self.change
+        return change is not None and change > self.threshold
+
+
+def get_historyfile() -> Path:
+    return get_rootdir() / HISTORY_FILENAME
+
+
+def append_record(record: Record, path: Path | None = None) -> None:
+    path = path or get_historyfile()
+    with path.open("a") as f:
+        f.write(json.dumps(asdict(record)) + "\n")
+
+
+def iter_records(path: Path | None = None) -> Iterator[Record]:
+    path = path or get_historyfile()
+    try:
+        f = path.open()
+    except FileNotFoundError:
+        return
+
+    with f:
+        for line in f:
+            if line.strip():
+                yield Record(**json.loads(line))
+
+
+def compare(
+    dp: DayPart,
+    samples: list[int],
+    ref: str,
+    *,
+    threshold: float = 0.1,
+    path: Path | None = None,
+    commit: str | None = None,
+) -> Comparison:
+    """
+    Compare the median of samples against the median of all samples stored
+    for the same day/part and python version at commit `ref`. Records taken
+    from a dirty working tree are never used as a baseline. Pass the
+    `commit` that `ref` resolves to, if known, to skip running git.
+    """
+    if commit is None:
+        commit = get_commit(ref)
+    python = get_python_version()
+    baseline_samples = [
+        sample
+        for record in iter_records(path)
+        if record.daypart == dp
+        and record.commit == commit
+        and record.python == python
+        and not record.dirty
+        for sample in record.samples
+    ]
+    return Comparison(
+        dp=dp,
+        ref=ref,
+        median=statistics.median(samples),
+        baseline=statistics.median(baseline_samples) if baseline_samples else None,
+        threshold=threshold,
+    )
+
+
+def get_commit(ref: str = "HEAD") -> str:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--verify", f"{ref}^{{commit}}"],
+            check=True,
+            capture_output=True,
+            text=True,
+            cwd=get_rootdir(),
+        )
+    except subprocess.CalledProcessError:
+        raise HandledError(f"unable to resolve git ref: {ref!r}")
+    return result.stdout.strip()
+
+
+def is_dirty() -> bool:
+    result = subprocess.run(
+        ["git", "status", "--porcelain", "--untracked-files=no"],
+        check=True,
+        capture_output=True,
+        text=True,
+        cwd=get_rootdir(),
+    )
+    return bool(result.stdout.strip())
+
+
+def get_python_version() -> str:
+    return f"{platform.python_implementation()} {platform.python_version()}"
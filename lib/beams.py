@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import final
+
+from .graph import reachable_union
+from .parser import DOWN
+from .parser import FlatGrid
+from .parser import LEFT
+from .parser import Point
+from .parser import RIGHT
+from .parser import UP
+
+
+# in the order of FlatGrid.offsets4
+_DIRECTIONS = (UP, RIGHT, DOWN, LEFT)
+
+# outgoing directions per mirror/splitter and incoming direction
+_TURNS: dict[int, tuple[tuple[int, ...], ...]] = {
+    ord("/"): ((1,), (0,), (3,), (2,)),
+    ord("\\"): ((3,), (2,), (1,), (0,)),
+    ord("|"): ((0,), (0, 2), (2,), (0, 2)),
+    ord("-"): ((1, 3), (1,), (1, 3), (3,)),
+}
+
+
+@final
+class BeamGrid:
+    """
+    Beams of light through a grid of empty tiles (.), mirrors (/ \\) and
+    splitters (| -), precomputed so that the tiles energized from any entry
+    point take a straight walk to the first mirror and a lookup.
+
+    A beam state is a mirror and the direction the beam arrives from. It
+    energizes the mirror and the straight runs leaving it up to the next
+    mirrors, whose states it leads to. States on a loop energize the same
+    tiles, so the energized tiles, a bitset over tile indices, are
+    combined once per strongly connected component with `reachable_union`.
+    """
+    __slots__ = ("_grid", "_mirrors", "_energized")
+
+    def __init__(self, grid: FlatGrid) -> None:
+        self._grid = grid
+        cells = grid.cells
+        # state ids are 4 * mirror id + incoming direction
+        self._mirrors = {
+            index: mirror
+            for mirror, index in enumerate(
+                index for index in grid.iter_indices() if cells[index] in _TURNS
+            )
+        }
+
+        tiles: list[int] = []
+        successors: list[list[int]] = []
+        for index in self._mirrors:
+            for outgoing in _TURNS[cells[index]]:
+                state_tiles = 1 << index
+                state_successors = []
+                for direction in outgoing:
+                    run, n = self._run(index + grid.offsets4[direction], direction)
+                    state_tiles |= run
+                    if n >= 0:
+                        state_successors.append(n)
+                tiles.append(state_tiles)
+                successors.append(state_successors)
+
+        self._energized = reachable_union(successors, tiles)
+
+    @classmethod
+    def from_str(cls, s: str) -> BeamGrid:
+        return cls(FlatGrid.from_str(s, sentinel="#"))
+
+    def _run(self, index: int, direction: int) -> tuple[int, int]:
+        """
+        tiles of the straight run from index up to the grid edge or the
+        next mirror, and the state at that mirror (-1 at the edge)
+        """
+        cells = self._grid.cells
+        sentinel = self._grid.sentinel
+        step = self._grid.offsets4[direction]
+        tiles = 0
+        while (cell := cells[index]) != sentinel:
+            if cell in _TURNS:
+                return tiles, 4 * self._mirrors[index] + direction
+            tiles |= 1 << index
+            index += step
+        return tiles, -1
+
+    def energized(self, start: Point, direction: Point) -> int:
+        """number of tiles energized by a beam entering at start in direction"""
+        tiles, state = self._run(self._grid.index(start), _DIRECTIONS.index(direction))
+        if state >= 0:
+            tiles |= self._energized[state]
+        return tiles.bit_count()
+
+    def iter_entries(self) -> Iterator[tuple[Point, Point]]:
+        """the edge tiles with the direction pointing into the grid"""
+        width, height = self._grid.col_len(), self._grid.row_len()
+        for y in range(height):
+            yield Point(0, y), RIGHT
+            yield Point(width - 1, y), LEFT
+        for x in range(width):
+            yield Point(x, 0), DOWN
+            yield Point(x, height - 1), UP
+
+
+__all__ = [
+    "BeamGrid",
+]
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import final
+
+import numpy as np
+import numpy.typing as npt
+
+
+type IntArray = npt.NDArray[np.intp]
+
+
+@final
+@dataclass(frozen=True)
+class SettledBricks:
+    """
+    Bricks after falling onto the ground, at height 0, and onto each other.
+    `bases[i]` is the height brick i comes to rest at. The support graph is
+    stored in compressed sparse row form: the bricks directly below and
+    touching brick i are `supporters[offsets[i]:offsets[i + 1]]`.
+    """
+    bases: IntArray
+    offsets: IntArray
+    supporters: IntArray
+
+    def __len__(self) -> int:
+        return len(self.bases)
+
+    def supported_by(self, brick: int, /) -> IntArray:
+        return self.supporters[self.offsets[brick]:self.offsets[brick + 1]]
+
+    def predecessors(self) -> list[list[int]]:
+        """supporters of each brick as lists, e.g., for `dominator_tree`"""
+        supporters = self.supporters.tolist()
+        offsets = self.offsets.tolist()
+        return [supporters[start:stop] for start, stop in zip(offsets, offsets[1:])]
+
+    def sole_supporters(self) -> IntArray:
+        """the bricks that are the only support of some brick"""
+        counts = np.diff(self.offsets)
+        return np.unique(self.supporters[self.offsets[:-1][counts == 1]])
+
+
+def settle_bricks(bricks: npt.ArrayLike) -> SettledBricks:
+    """
+    Let bricks, rows of inclusive corners `(x0, y0, z0, x1, y1, z1)` sorted
+    by their lowest z, fall straight down until they rest on the ground or
+    another brick.
+
+    Settling keeps a 2d height array and an array of the id of the top
+    brick over the xy plane. Each brick reads and writes its footprint as a
+    rectangular slice of both.
+    """
+    array = np.asarray(bricks, dtype=np.int64).reshape(-1, 6)
+    lo = np.minimum(array[:, :3], array[:, 3:])
+    hi = np.maximum(array[:, :3], array[:, 3:])
+    if np.any(np.diff(lo[:, 2]) < 0):
+        raise ValueError("bricks must be sorted by their lowest z")
+
+    origin = lo[:, :2].min(axis=0, initial=0)
+    lo[:, :2] -= origin
+    hi[:, :2] -= origin
+    shape = tuple(hi[:, :2].max(axis=0, initial=0) + 1)
+
+    heights = np.zeros(shape, dtype=np.int64)
+    top = np.full(shape, -1, dtype=np.intp)
+    bases = np.empty(len(array), dtype=np.intp)
+    counts = np.zeros(len(array) + 1, dtype=np.intp)
+    supporters: list[IntArray] = []
+
+    footprints = np.column_stack((lo[:, :2], hi[:, :2] + 1, hi[:, 2] - lo[:, 2] + 1))
+    for i, (x0, y0, x1, y1, size) in enumerate(footprints.tolist()):
+        footprint = (slice(x0, x1), slice(y0, y1))
+        below = heights[footprint]
+        base = below.max()
+        if base:
+            ids = np.unique(top[footprint][below == base])
+            supporters.append(ids)
+            counts[i + 1] = len(ids)
+
+        bases[i] = base
+        heights[footprint] = base + size
+        top[footprint] = i
+
+    return SettledBricks(
+        bases=bases,
+        offsets=np.cumsum(counts),
+        supporters=np.concatenate(supporters) if supporters else np.empty(0, dtype=np.intp),
+    )
+
+
+__all__ = [
+    "settle_bricks",
+    "SettledBricks",
+]
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+from .graph import shortest_path
+from .parser import FlatGrid
+from .parser import Point
+
+
+_ZERO = ord("0")
+_MAX_HEAT = 9
+
+
+def min_heat_loss(
+    grid: FlatGrid,
+    min_straight: int,
+    max_straight: int,
+    *,
+    bucket_queue: bool = True,
+) -> int:
+    """
+    Least heat loss of a crucible moving from the top left to the bottom
+    right of a sentinel padded grid of digits, turning after moving
+    `min_straight` to `max_straight` blocks in a straight line.
+
+    States are (location, axis of the last move), encoded as
+    `2 * location + axis`. From each state the crucible turns and moves
+    along the other axis. With `bucket_queue` the frontier is a
+    `BucketQueue`, as a move loses at most 9 heat per block, else a heap.
+    """
+    if not 0 < min_straight <= max_straight:
+        raise ValueError(
+            f"expected 0 < min_straight <= max_straight, provided: {min_straight}, {max_straight}"
+        )
+
+    cells = grid.cells
+    border = grid.sentinel
+    heat = [c - _ZERO for c in cells]
+    width = grid.width
+    start = grid.index(Point(0, 0))
+    end = grid.index(Point(grid.col_len() - 1, grid.row_len() - 1))
+
+    def neighbors(state: int) -> Iterator[tuple[int, int]]:
+        loc, axis = divmod(state, 2)
+        for step in (width, -width) if axis == 0 else (1, -1):
+            n = loc
+            loss = 0
+            for k in range(1, max_straight + 1):
+                n += step
+                if cells[n] == border:
+                    break
+                loss += heat[n]
+                if k >= min_straight:
+                    yield 2 * n + 1 - axis, loss
+
+    def is_goal(state: int) -> bool:
+        return state // 2 == end
+
+    return shortest_path(
+        (2 * start, 2 * start + 1),
+        neighbors,
+        is_goal,
+        size=2 * len(grid),
+        max_weight=_MAX_HEAT * max_straight if bucket_queue else None,
+    )
+
+
+__all__ = [
+    "min_heat_loss",
+]
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import final
+
+
+@final
+@dataclass(frozen=True)
+class Cycle:
+    """
+    The states of an iterated function repeat with `period` once `offset`
+    steps have been taken, i.e., state(i + period) == state(i) for all
+    i >= offset.
+    """
+    offset: int
+    period: int
+
+    def index(self, n: int) -> int:
+        """the first step with the same state as step n"""
+        if n < self.offset:
+            return n
+        return self.offset + (n - self.offset) % self.period
+
+
+def _identity[S](state: S) -> S:
+    return state
+
+
+def _digest(key: Hashable) -> int:
+    # the hash of an int is its value modulo 2**61 - 1, so big int keys,
+    # e.g., bitboards, would collide whenever bits 61 apart are swapped
+    if isinstance(key, int):
+        return hash(key.to_bytes((key.bit_length() + 8) // 8, signed=True))
+    return hash(key)
+
+
+def brent[S](
+    start: S,
+    step: Callable[[S], S],
+    key: Callable[[S], Hashable] = _identity,
+) -> Cycle:
+    """
+    Find the cycle of the states `start, step(start), ...` with Brent's
+    algorithm, comparing states by `key`. Keeps O(1) states in memory, at
+    the cost of stepping up to about 2 * (offset + period) + period times.
+    """
+    # find the period: a tortoise waits at powers of two for the hare
+    power = period = 1
+    tortoise = key(start)
+    hare = step(start)
+    while tortoise != key(hare):
+        if power == period:
+            tortoise = key(hare)
+            power *= 2
+            period = 0
+        hare = step(hare)
+        period += 1
+
+    # find the offset: advance two states a period apart until they meet
+    tortoise_state = hare_state = start
+    for _ in range(period):
+        hare_state = step(hare_state)
+    offset = 0
+    while key(tortoise_state) != key(hare_state):
+        tortoise_state = step(tortoise_state)
+        hare_state = step(hare_state)
+        offset += 1
+
+    return Cycle(offset, period)
+
+
+def find_cycle[S](
+    start: S,
+    step: Callable[[S], S],
+    key: Callable[[S], Hashable] = _identity,
+) -> tuple[Cycle, S]:
+    """
+    Find the cycle of the states `start, step(start), ...` in exactly
+    offset + period steps, remembering the 64-bit `hash` of each state's
+    `key` rather than the states. Also returns the last state computed,
+    which is the state at step offset + period, i.e., the one at `offset`.
+
+    Distinct keys with colliding hashes would be mistaken for a cycle, so
+    keys should hash well, e.g., str, bytes or int.
+    """
+    seen: dict[int, int] = {}
+    state = start
+    i = 0
+    while (digest := _digest(key(state))) not in seen:
+        seen[digest] = i
+        state = step(state)
+        i += 1
+
+    offset = seen[digest]
+    return Cycle(offset, i - offset), state
+
+
+def nth_state[S](
+    start: S,
+    step: Callable[[S], S],
+    n: int,
+    key: Callable[[S], Hashable] = _identity,
+) -> S:
+    """
+    The state after n steps from `start`, e.g., of a simulation run a
+    billion times, extrapolated from the cycle found by `find_cycle`.
+    Takes at most offset + 2 * period steps.
+    """
+    if n < 0:
+        raise ValueError(f"n must be non-negative, provided: {n}")
+
+    seen: dict[int, int] = {}
+    state = start
+    for i in range(n):
+        digest = _digest(key(state))
+        if digest in seen:
+            cycle = Cycle(seen[digest], i - seen[digest])
+            # the current state is the one at cycle.offset
+            for _ in range(cycle.index(n) - cycle.offset):
+                state = step(state)
+            return state
+
+        seen[digest] = i
+        state = step(state)
+
+    return state
+
+
+__all__ = [
+    "brent",
+    "Cycle",
+    "find_cycle",
+    "nth_state",
+]
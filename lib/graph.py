@@ -0,0 +1,898 @@
+from __future__ import annotations
+
+import heapq
+import math
+from collections import deque
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import MutableSequence
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from random import Random
+from typing import final
+from typing import Protocol
+
+from .parser import Point
+
+
+type Neighbors = Callable[[int], Iterable[tuple[int, int]]]
+"""Maps a state to its (neighbor state, edge weight) pairs"""
+
+_UNSEEN = 1 << 62
+_KARGER_STEIN_BASE = 50
+
+
+@final
+class StateEncoder:
+    """
+    Mixed radix encoding of a tuple of small non-negative ints, e.g.,
+    (location, direction, straight-line-count), into a single int in
+    `range(encoder.size)`, with the last component varying fastest.
+    """
+    __slots__ = ("sizes", "size", "_strides")
+
+    def __init__(self, *sizes: int) -> None:
+        if not sizes or any(size <= 0 for size in sizes):
+            raise ValueError(f"sizes must be positive, provided: {sizes}")
+
+        strides = []
+        stride = 1
+        for size in reversed(sizes):
+            strides.append(stride)
+            stride *= size
+
+        self.sizes = sizes
+        self.size = stride
+        self._strides = tuple(reversed(strides))
+
+    def encode(self, *values: int) -> int:
+        state = 0
+        for value, size, stride in zip(values, self.sizes, self._strides, strict=True):
+            if not 0 <= value < size:
+                raise ValueError(f"value {value} out of range for size {size}")
+            state += value * stride
+        return state
+
+    def decode(self, state: int, /) -> tuple[int, ...]:
+        if not 0 <= state < self.size:
+            raise ValueError(f"state {state} out of range for size {self.size}")
+
+        values = []
+        for size in reversed(self.sizes):
+            state, value = divmod(state, size)
+            values.append(value)
+        return tuple(reversed(values))
+
+
+@final
+class BucketQueue[T]:
+    """
+    Monotone priority queue for small integer priorities (Dial's algorithm).
+    Items are kept in a circular array of `max_step + 1` buckets keyed on
+    `priority % (max_step + 1)`, so push and pop are O(1) amortized.
+
+    Pushed priorities must lie within `max_step` of the current minimum,
+    i.e., the last popped priority, as is the case for Dijkstra's algorithm
+    when edge weights are at most `max_step`.
+    """
+    __slots__ = ("_buckets", "_nbuckets", "_current", "_len")
+
+    def __init__(self, max_step: int) -> None:
+        if max_step < 0:
+            raise ValueError(f"max_step must be non-negative, provided: {max_step}")
+        self._nbuckets = max_step + 1
+        self._buckets: list[list[T]] = [[] for _ in range(self._nbuckets)]
+        self._current = 0
+        self._len = 0
+
+    def push(self, priority: int, item: T) -> None:
+        if not self._len:
+            self._current = priority
+        elif not self._current <= priority < self._current + self._nbuckets:
+            raise ValueError(
+                f"priority {priority} outside of the supported range"
+                f" [{self._current}, {self._current + self._nbuckets})"
+            )
+        self._buckets[priority % self._nbuckets].append(item)
+        self._len += 1
+
+    def pop(self) -> tuple[int, T]:
+        """Remove and return the (priority, item) with the smallest priority"""
+        if not self._len:
+            raise IndexError("pop from empty queue")
+
+        buckets = self._buckets
+        nbuckets = self._nbuckets
+        current = self._current
+        while not buckets[current % nbuckets]:
+            current += 1
+        self._current = current
+        self._len -= 1
+        return current, buckets[current % nbuckets].pop()
+
+    def __len__(self) -> int:
+        return self._len
+
+
+@final
+class DisjointSet:
+    """
+    Union-find over the ints in `range(size)`, backed by flat lists, with
+    union by size and path compression (halving).
+    """
+    __slots__ = ("_parent", "_sizes", "_components")
+
+    def __init__(self, size: int) -> None:
+        if size < 0:
+            raise ValueError(f"size must be non-negative, provided: {size}")
+        self._parent = list(range(size))
+        self._sizes = [1] * size
+        self._components = size
+
+    def find(self, x: int, /) -> int:
+        """representative of the set containing x"""
+        parent = self._parent
+        while parent[x] != x:
+            parent[x] = x = parent[parent[x]]
+        return x
+
+    def union(self, a: int, b: int, /) -> bool:
+        """merge the sets containing a and b, False if already merged"""
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return False
+
+        sizes = self._sizes
+        if sizes[ra] < sizes[rb]:
+            ra, rb = rb, ra
+        self._parent[rb] = ra
+        sizes[ra] += sizes[rb]
+        self._components -= 1
+        return True
+
+    def connected(self, a: int, b: int, /) -> bool:
+        return self.find(a) == self.find(b)
+
+    def size(self, x: int, /) -> int:
+        """number of elements in the set containing x"""
+        return self._sizes[self.find(x)]
+
+    @property
+    def components(self) -> int:
+        """number of disjoint sets"""
+        return self._components
+
+    def reset(self) -> None:
+        """split every element back into its own set"""
+        size = len(self._parent)
+        self._parent[:] = range(size)
+        self._sizes[:] = [1] * size
+        self._components = size
+
+    def __len__(self) -> int:
+        return len(self._parent)
+
+
+def shortest_path(
+    starts: Iterable[int],
+    neighbors: Neighbors,
+    is_goal: Callable[[int], bool],
+    *,
+    heuristic: Callable[[int], int] | None = None,
+    size: int | None = None,
+    max_weight: int | None = None,
+) -> int:
+    """
+    Cost of the cheapest path from any of the `starts` to a goal state, using
+    Dijkstra's algorithm, or A* if a `heuristic` is provided. The heuristic
+    must never overestimate the remaining cost and must be consistent. Edge
+    weights must be non-negative.
+
+    If the number of states is known, provide `size` to track distances in a
+    list rather than a dict.
+
+    If edge weights are small integers, provide their maximum as `max_weight`
+    to use a `BucketQueue` rather than a binary heap as the frontier. With a
+    heuristic, `max_weight` must instead bound `weight + h(n) - h(state)`.
+
+    Raises ValueError if no goal state is reachable.
+    """
+    if max_weight is not None:
+        return _shortest_path_buckets(
+            starts, neighbors, is_goal, heuristic, size, max_weight
+        )
+
+    dist: MutableSequence[int] | _Distances
+    dist = [_UNSEEN] * size if size is not None else _Distances()
+
+    # this loop is repeated in `_shortest_path_buckets` with the frontier
+    # operations inlined, sharing one loop through push/pop callables made
+    # the day 17 search 25-35% slower, keep any fixes to both in sync
+    heap: list[tuple[int, int, int]] = []
+    for start in starts:
+        dist[start] = 0
+        heap.append((heuristic(start) if heuristic else 0, 0, start))
+    heapq.heapify(heap)
+
+    heappop = heapq.heappop
+    heappush = heapq.heappush
+    while heap:
+        _, d, state = heappop(heap)
+        if d > dist[state]:
+            # stale entry, state was reached more cheaply since
+            continue
+
+        if is_goal(state):
+            return d
+
+        for n, weight in neighbors(state):
+            nd = d + weight
+            if nd < dist[n]:
+                dist[n] = nd
+                heappush(heap, (nd + heuristic(n) if heuristic else nd, nd, n))
+
+    raise ValueError("no goal state is reachable")
+
+
+def _shortest_path_buckets(
+    starts: Iterable[int],
+    neighbors: Neighbors,
+    is_goal: Callable[[int], bool],
+    heuristic: Callable[[int], int] | None,
+    size: int | None,
+    max_weight: int,
+) -> int:
+    # the loop of `shortest_path` with a BucketQueue frontier, keep in sync
+    dist: MutableSequence[int] | _Distances
+    dist = [_UNSEEN] * size if size is not None else _Distances()
+
+    queue: BucketQueue[tuple[int, int]] = BucketQueue(max_weight)
+    # lowest priority first, so that it becomes the queue's current minimum
+    for start in sorted(starts, key=heuristic):
+        dist[start] = 0
+        queue.push(heuristic(start) if heuristic else 0, (0, start))
+
+    push = queue.push
+    pop = queue.pop
+    while queue:
+        _, (d, state) = pop()
+        if d > dist[state]:
+            # stale entry, state was reached more cheaply since
+            continue
+
+        if is_goal(state):
+            return d
+
+        for n, weight in neighbors(state):
+            nd = d + weight
+            if nd < dist[n]:
+                dist[n] = nd
+                push(nd + heuristic(n) if heuristic else nd, (nd, n))
+
+    raise ValueError("no goal state is reachable")
+
+
+class _Grid[T](Protocol):
+    def __getitem__(self, key: tuple[int, int], /) -> T: ...
+    def row_len(self) -> int: ...
+    def col_len(self) -> int: ...
+    def in_bounds(self, p: Point) -> bool: ...
+
+
+@final
+@dataclass(frozen=True)
+class JunctionGraph:
+    """
+    Weighted undirected graph of the junctions of a maze. Node ids index into
+    `nodes` (their locations) and `edges` (their (neighbor, length) pairs).
+    """
+    nodes: tuple[Point, ...]
+    edges: tuple[tuple[tuple[int, int], ...], ...]
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def index(self, p: Point, /) -> int:
+        return self.nodes.index(p)
+
+
+def junction_graph[T](
+    grid: _Grid[T],
+    passable: Callable[[T], bool],
+    keep: Iterable[Point] = (),
+) -> JunctionGraph:
+    """
+    Compress a maze into a graph over its junctions. Nodes are passable
+    cells without exactly two passable neighbors (junctions and dead ends)
+    and the points in `keep`, e.g., the entrance and exit. Corridors between
+    nodes become edges weighted by their number of steps. Node ids are
+    assigned in row major order.
+
+    Parallel corridors between the same pair of nodes are kept as separate
+    edges, corridors looping back onto the same node are dropped.
+    """
+    def open_neighbors(p: Point) -> list[Point]:
+        return [
+            n for n in p.iter_neighbors(diagonals=False)
+            if grid.in_bounds(n) and passable(grid[n])
+        ]
+
+    kept = set(keep)
+    nodes = [
+        p
+        for y in range(grid.row_len())
+        for x in range(grid.col_len())
+        if passable(grid[(p := Point(x, y))])
+        and (p in kept or len(open_neighbors(p)) != 2)
+    ]
+    ids = {p: i for i, p in enumerate(nodes)}
+
+    edges: list[tuple[tuple[int, int], ...]] = []
+    for node in nodes:
+        node_edges = []
+        for loc in open_neighbors(node):
+            last = node
+            length = 1
+            while loc not in ids:
+                last, loc = loc, next(n for n in open_neighbors(loc) if n != last)
+                length += 1
+
+            if loc != node:
+                node_edges.append((ids[loc], length))
+        edges.append(tuple(node_edges))
+
+    return JunctionGraph(tuple(nodes), tuple(edges))
+
+
+type _Adjacency = tuple[tuple[tuple[int, int, int, int, int], ...], ...]
+"""per node: (neighbor bit, neighbor, edge weight, neighbor cost, neighbor top edge)"""
+
+type _State = tuple[int, int, int, int]
+"""(node, visited mask, length, remaining cost)"""
+
+
+def longest_path(
+    edges: Sequence[Iterable[tuple[int, int]]],
+    start: int,
+    end: int,
+    *,
+    jobs: int = 1,
+) -> int:
+    """
+    Length of the longest simple path from `start` to `end` in a small
+    undirected graph, e.g., the `edges` of a `JunctionGraph`. The search is
+    an exhaustive depth first search over an int bitmask of visited nodes,
+    trying the heaviest edges first, with
+
+    - branch and bound: every node on a path is incident to at most two of
+      its edges, so twice the length of a path is bounded by the sum of the
+      two heaviest edges of each node still to be visited. Branches whose
+      bound can not beat the best path so far are abandoned.
+    - if `end` has a single neighbor, reaching that neighbor ends the path,
+      as leaving it any other way would cut off `end`
+
+    With `jobs > 1` the top of the search tree is split across a process
+    pool.
+
+    Raises ValueError if `end` is not reachable.
+    """
+    if jobs <= 0:
+        raise ValueError(f"jobs must be positive, provided: {jobs}")
+
+    # only the heaviest of any parallel edges can be part of a longest path
+    weights: list[dict[int, int]] = [{} for _ in edges]
+    for node, node_edges in enumerate(edges):
+        for n, weight in node_edges:
+            if n != node:
+                weights[node][n] = max(weight, weights[node].get(n, 0))
+
+    target, extra = end, 0
+    if start != end and len(weights[end]) == 1:
+        ((target, extra),) = weights[end].items()
+
+    top = [sorted(w.values(), reverse=True) + [0, 0] for w in weights]
+    costs = [first + second for first, second, *_ in top]
+    costs[target] = top[target][0]
+    adjacency: _Adjacency = tuple(
+        tuple(sorted(
+            ((1 << n, n, weight, costs[n], top[n][0]) for n, weight in w.items()),
+            key=lambda edge: -edge[2],
+        ))
+        for w in weights
+    )
+    state = (start, 1 << start, 0, sum(costs) - costs[start])
+
+    if jobs == 1:
+        best = _longest_from(adjacency, target, state)
+    else:
+        states = _split_states(adjacency, target, state, 8 * jobs)
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [executor.submit(_longest_from, adjacency, target, s) for s in states]
+            best = max((f.result() for f in futures), default=-1)
+
+    if best < 0:
+        raise ValueError(f"end node {end} is not reachable from {start}")
+    return best + extra
+
+
+def _longest_from(adjacency: _Adjacency, target: int, state: _State) -> int:
+    best = -1
+
+    def dfs(node: int, mask: int, length: int, remaining: int) -> None:
+        nonlocal best
+        if node == target:
+            if length > best:
+                best = length
+            return
+
+        for bit, n, weight, cost, top in adjacency[node]:
+            if not mask & bit:
+                r = remaining - cost
+                nlength = length + weight
+                if 2 * nlength + top + r > 2 * best:
+                    dfs(n, mask | bit, nlength, r)
+
+    dfs(*state)
+    return best
+
+
+def _split_states(
+    adjacency: _Adjacency,
+    target: int,
+    state: _State,
+    count: int,
+) -> list[_State]:
+    """expand search states breadth first until there are at least count"""
+    states = [state]
+    while len(states) < count:
+        expanded = []
+        for node, mask, length, remaining in states:
+            if node == target:
+                expanded.append((node, mask, length, remaining))
+                continue
+
+            for bit, n, weight, cost, _ in adjacency[node]:
+                if not mask & bit:
+                    expanded.append((n, mask | bit, length + weight, remaining - cost))
+
+        if len(expanded) <= len(states):
+            break
+        states = expanded
+
+    return states
+
+
+@final
+@dataclass(frozen=True)
+class Cut:
+    """A cut of a graph: its total edge weight and the node ids on one side"""
+    weight: int
+    side: frozenset[int]
+
+
+def _merged_weights(edges: Sequence[Iterable[tuple[int, int]]]) -> list[dict[int, int]]:
+    """adjacency as dicts, summing parallel edges and dropping self loops"""
+    weights: list[dict[int, int]] = [{} for _ in edges]
+    for node, node_edges in enumerate(edges):
+        for n, weight in node_edges:
+            if n != node:
+                weights[node][n] = weights[node].get(n, 0) + weight
+    return weights
+
+
+def min_st_cut(
+    edges: Sequence[Iterable[tuple[int, int]]],
+    source: int,
+    sink: int,
+) -> Cut:
+    """
+    Minimum cut separating `source` from `sink` in an undirected graph with
+    non-negative integer edge weights, listed at both ends, via max flow
+    (Edmonds-Karp). The returned side contains `source`.
+
+    Each augmenting path is found by a breadth first search, so the cost is
+    O(E) per unit of flow for unit weights.
+    """
+    if source == sink:
+        raise ValueError(f"source and sink must differ, provided: {source}")
+
+    residual = _merged_weights(edges)
+    flow = 0
+    while True:
+        parents = {source: source}
+        queue = deque([source])
+        while queue and sink not in parents:
+            node = queue.popleft()
+            for n, capacity in residual[node].items():
+                if capacity and n not in parents:
+                    parents[n] = node
+                    queue.append(n)
+
+        if sink not in parents:
+            return Cut(flow, frozenset(parents))
+
+        path = []
+        node = sink
+        while node != source:
+            path.append((parents[node], node))
+            node = parents[node]
+        bottleneck = min(residual[a][b] for a, b in path)
+        for a, b in path:
+            residual[a][b] -= bottleneck
+            residual[b][a] += bottleneck
+        flow += bottleneck
+
+
+def stoer_wagner(edges: Sequence[Iterable[tuple[int, int]]]) -> Cut:
+    """
+    Global minimum cut of a connected undirected graph with non-negative
+    edge weights, listed at both ends, via the Stoer-Wagner algorithm in
+    O(V * E * log(V)).
+    """
+    if len(edges) < 2:
+        raise ValueError("a cut needs at least 2 nodes")
+
+    weights = _merged_weights(edges)
+    members = [[node] for node in range(len(weights))]
+    active = list(range(len(weights)))
+    best = Cut(_UNSEEN, frozenset())
+
+    heappop = heapq.heappop
+    heappush = heapq.heappush
+    while len(active) > 1:
+        # maximum adjacency ordering, the last two nodes are s-t min cut
+        # separated by the cut of the phase
+        connectivity = dict.fromkeys(active, 0)
+        added = set()
+        heap = [(0, active[0])]
+        prev = last = active[0]
+        phase_cut = 0
+        while heap:
+            negative, node = heappop(heap)
+            if node in added or -negative != connectivity[node]:
+                continue
+            added.add(node)
+            prev, last, phase_cut = last, node, -negative
+            for n, weight in weights[node].items():
+                if n not in added:
+                    connectivity[n] += weight
+                    heappush(heap, (-connectivity[n], n))
+
+        if len(added) < len(active):
+            # disconnected
+            return Cut(0, frozenset(n for node in added for n in members[node]))
+
+        if phase_cut < best.weight:
+            best = Cut(phase_cut, frozenset(members[last]))
+
+        # merge last into prev
+        for n, weight in weights[last].items():
+            del weights[n][last]
+            if n != prev:
+                weights[prev][n] = weights[prev].get(n, 0) + weight
+                weights[n][prev] = weights[n].get(prev, 0) + weight
+        weights[last].clear()
+        members[prev].extend(members[last])
+        active.remove(last)
+
+    return best
+
+
+def karger_stein(
+    edges: Sequence[Iterable[tuple[int, int]]],
+    *,
+    rng: Random | None = None,
+) -> Cut:
+    """
+    Minimum cut candidate of a connected undirected graph with positive
+    integer edge weights, listed at both ends, via Karger-Stein recursive
+    random contraction. A single run finds a minimum cut with probability
+    Ω(1/log(V)), so repeat it and keep the lightest cut. Each run costs
+    O(V^2) overall, prefer `stoer_wagner` for a deterministic result.
+
+    Contraction merges endpoints of edges in a weighted random order with a
+    `DisjointSet`, i.e., Kruskal's algorithm on random edge keys.
+    """
+    if len(edges) < 2:
+        raise ValueError("a cut needs at least 2 nodes")
+
+    pairs = [
+        (node, n, weight)
+        for node, node_weights in enumerate(_merged_weights(edges))
+        for n, weight in node_weights.items()
+        if node < n
+    ]
+    weight, side = _karger_stein(len(edges), pairs, rng or Random())
+    return Cut(weight, frozenset(side))
+
+
+def _karger_stein(
+    size: int,
+    pairs: list[tuple[int, int, int]],
+    rng: Random,
+) -> tuple[int, list[int]]:
+    if size <= _KARGER_STEIN_BASE:
+        graph: list[list[tuple[int, int]]] = [[] for _ in range(size)]
+        for a, b, weight in pairs:
+            graph[a].append((b, weight))
+            graph[b].append((a, weight))
+        cut = stoer_wagner(graph)
+        return cut.weight, list(cut.side)
+
+    target = math.ceil(1 + size / math.sqrt(2))
+    best_weight, best_side = _UNSEEN, []
+    for _ in range(2):
+        labels, contracted_size, contracted = _contract(size, pairs, target, rng)
+        weight, side = _karger_stein(contracted_size, contracted, rng)
+        if weight < best_weight:
+            in_side = [False] * contracted_size
+            for label in side:
+                in_side[label] = True
+            best_weight = weight
+            best_side = [node for node, label in enumerate(labels) if in_side[label]]
+    return best_weight, best_side
+
+
+def _contract(
+    size: int,
+    pairs: list[tuple[int, int, int]],
+    target: int,
+    rng: Random,
+) -> tuple[list[int], int, list[tuple[int, int, int]]]:
+    """
+    Randomly contract edges until `target` nodes remain. Returns the new
+    label of each node, the number of labels and the relabeled edges.
+    """
+    sets = DisjointSet(size)
+    expovariate = rng.expovariate
+    for _, a, b in sorted((expovariate(weight), a, b) for a, b, weight in pairs):
+        if sets.components <= target:
+            break
+        sets.union(a, b)
+
+    roots: dict[int, int] = {}
+    labels = [roots.setdefault(sets.find(node), len(roots)) for node in range(size)]
+
+    merged: dict[tuple[int, int], int] = {}
+    for a, b, weight in pairs:
+        la, lb = labels[a], labels[b]
+        if la != lb:
+            key = (la, lb) if la < lb else (lb, la)
+            merged[key] = merged.get(key, 0) + weight
+
+    return labels, len(roots), [(a, b, weight) for (a, b), weight in merged.items()]
+
+
+def strongly_connected_components(successors: Sequence[Sequence[int]]) -> list[list[int]]:
+    """
+    Strongly connected components of the directed graph over nodes
+    `range(len(successors))`, via Tarjan's algorithm without recursion.
+    Components are listed in reverse topological order: every component
+    comes after all the components it leads to.
+    """
+    size = len(successors)
+    order = [-1] * size
+    low = [0] * size
+    on_stack = [False] * size
+    stack: list[int] = []
+    components: list[list[int]] = []
+    counter = 0
+
+    for root in range(size):
+        if order[root] >= 0:
+            continue
+
+        work = [(root, 0)]
+        while work:
+            node, i = work.pop()
+            if i == 0:
+                order[node] = low[node] = counter
+                counter += 1
+                stack.append(node)
+                on_stack[node] = True
+
+            node_successors = successors[node]
+            while i < len(node_successors):
+                n = node_successors[i]
+                i += 1
+                if order[n] < 0:
+                    # descend, resuming node at successor i afterwards
+                    work.append((node, i))
+                    work.append((n, 0))
+                    break
+                if on_stack[n] and order[n] < low[node]:
+                    low[node] = order[n]
+            else:
+                if low[node] == order[node]:
+                    component = []
+                    while True:
+                        n = stack.pop()
+                        on_stack[n] = False
+                        component.append(n)
+                        if n == node:
+                            break
+                    components.append(component)
+                if work:
+                    parent = work[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+
+    return components
+
+
+@final
+@dataclass(frozen=True)
+class Condensation:
+    """
+    DAG of the strongly connected components of a graph. Component ids are
+    in reverse topological order, so every successor of a component has a
+    smaller id.
+    """
+    components: list[list[int]]
+    component: list[int]
+    """component id of each node"""
+    successors: list[list[int]]
+    """successor component ids of each component, without duplicates"""
+
+    def __len__(self) -> int:
+        return len(self.components)
+
+
+def condensation(successors: Sequence[Sequence[int]]) -> Condensation:
+    components = strongly_connected_components(successors)
+    component = [0] * len(successors)
+    for c, members in enumerate(components):
+        for node in members:
+            component[node] = c
+
+    dag_successors = []
+    for c, members in enumerate(components):
+        dag_successors.append(sorted({
+            component[n] for node in members for n in successors[node]
+        } - {c}))
+    return Condensation(components, component, dag_successors)
+
+
+def reachable_union(
+    successors: Sequence[Sequence[int]],
+    values: Sequence[int],
+) -> list[int]:
+    """
+    For each node, the bitwise or of the `values` of all nodes reachable
+    from it, itself included, e.g., int bitsets of the tiles each node
+    covers. Values are combined once per component of the condensation,
+    and nodes of the same component share the resulting int.
+    """
+    dag = condensation(successors)
+    own = []
+    for members in dag.components:
+        union = 0
+        for node in members:
+            union |= values[node]
+        own.append(union)
+    return _propagate(dag, own)
+
+
+def reachable_sets(successors: Sequence[Sequence[int]]) -> list[int]:
+    """
+    For each node, the int bitset of the nodes reachable from it, itself
+    included. Each distinct set takes up to len(successors) / 8 bytes.
+    """
+    dag = condensation(successors)
+    own = []
+    for members in dag.components:
+        union = 0
+        for node in members:
+            union |= 1 << node
+        own.append(union)
+    return _propagate(dag, own)
+
+
+def _propagate(dag: Condensation, own: list[int]) -> list[int]:
+    unions: list[int] = []
+    for union, dag_successors in zip(own, dag.successors):
+        for c in dag_successors:
+            union |= unions[c]
+        unions.append(union)
+    return [unions[c] for c in dag.component]
+
+
+def dominator_tree(predecessors: Sequence[Sequence[int]]) -> list[int]:
+    """
+    Immediate dominator of each node of a DAG given in topological order,
+    i.e., every predecessor of a node has a smaller id. Nodes without
+    predecessors hang off a virtual root, -1, which all paths start from.
+
+    A node's immediate dominator is the lowest common ancestor of its
+    predecessors in the tree built so far, found by binary lifting, for
+    O((V + E) * log(V)) overall.
+    """
+    size = len(predecessors)
+    root = size
+    depth = [0] * (size + 1)
+    # up[k][node] is the 2**k-th ancestor of node
+    up: list[list[int]] = [[root] * (size + 1)]
+
+    def ancestor(node: int, levels: int) -> int:
+        k = 0
+        while levels:
+            if levels & 1:
+                node = up[k][node]
+            levels >>= 1
+            k += 1
+        return node
+
+    def lca(a: int, b: int) -> int:
+        if depth[a] < depth[b]:
+            a, b = b, a
+        a = ancestor(a, depth[a] - depth[b])
+        if a == b:
+            return a
+        for k in reversed(range(len(up))):
+            if up[k][a] != up[k][b]:
+                a, b = up[k][a], up[k][b]
+        return up[0][a]
+
+    idom = [root] * size
+    for node, node_predecessors in enumerate(predecessors):
+        dominator = root
+        for i, p in enumerate(node_predecessors):
+            if not p < node:
+                raise ValueError(f"predecessor {p} of node {node} is not topologically before it")
+            dominator = p if i == 0 else lca(dominator, p)
+        idom[node] = dominator
+        depth[node] = depth[dominator] + 1
+
+        up[0][node] = dominator
+        k = 1
+        while (1 << k) <= depth[node]:
+            if k == len(up):
+                up.append([root] * (size + 1))
+            up[k][node] = up[k - 1][up[k - 1][node]]
+            k += 1
+
+    return [-1 if d == root else d for d in idom]
+
+
+def dominated_counts(predecessors: Sequence[Sequence[int]]) -> list[int]:
+    """
+    For each node of a DAG given in topological order (see
+    `dominator_tree`), the number of other nodes that every path from the
+    roots passes through it to reach, e.g., how many bricks would fall if
+    a brick were removed from a stack.
+    """
+    idom = dominator_tree(predecessors)
+    subtree = [1] * len(idom)
+    for node in reversed(range(len(idom))):
+        if idom[node] >= 0:
+            subtree[idom[node]] += subtree[node]
+    return [size - 1 for size in subtree]
+
+
+class _Distances(dict[int, int]):
+    def __missing__(self, key: int) -> int:
+        return _UNSEEN
+
+
+__all__ = [
+    "BucketQueue",
+    "condensation",
+    "Condensation",
+    "Cut",
+    "DisjointSet",
+    "dominated_counts",
+    "dominator_tree",
+    "JunctionGraph",
+    "junction_graph",
+    "karger_stein",
+    "longest_path",
+    "min_st_cut",
+    "Neighbors",
+    "reachable_sets",
+    "reachable_union",
+    "StateEncoder",
+    "shortest_path",
+    "stoer_wagner",
+    "strongly_connected_components",
+]
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sequence
+from typing import Any
+from typing import final
+from typing import overload
+from typing import SupportsIndex
+
+import numpy as np
+import numpy.typing as npt
+
+from .parser import Point
+
+
+@final
+class ArrayGrid[T](Sequence[Sequence[T]]):
+    """
+    Immutable grid backed by a read-only 2d numpy array, indexed as
+    `array[y, x]`. Mirrors the `FrozenGrid` api, but rows/cols are yielded as
+    array views and transforms (transpose, rotate, reflect) are O(1) views.
+    """
+    __slots__ = ("_array",)
+
+    type Array = npt.NDArray[Any]
+
+    def __init__(self, array: npt.ArrayLike, /) -> None:
+        arr = np.asarray(array)
+        if arr.ndim != 2:
+            raise ValueError(f"expected a 2d array, got {arr.ndim} dimensions")
+        if arr.flags.writeable:
+            arr = arr.view()
+            arr.flags.writeable = False
+        self._array = arr
+
+    @property
+    def array(self) -> Array:
+        return self._array
+
+    def iter_rows(self) -> Iterator[Array]:
+        yield from self._array
+
+    def iter_rev_rows(self) -> Iterator[Array]:
+        yield from self._array[::-1]
+
+    def iter_cols(self) -> Iterator[Array]:
+        yield from self._array.T
+
+    def iter_rev_cols(self) -> Iterator[Array]:
+        yield from self._array.T[::-1]
+
+    def iter_values(self) -> Iterator[T]:
+        return iter(self._array.flat)
+
+    def enum_rows(self) -> Iterator[tuple[int, Array]]:
+        yield from enumerate(self.iter_rows())
+
+    def enum_cols(self) -> Iterator[tuple[int, Array]]:
+        yield from enumerate(self.iter_cols())
+
+    def enum_values(self) -> Iterator[tuple[Point, T]]:
+        for (y, x), value in np.ndenumerate(self._array):
+            yield Point(x, y), value
+
+    def row_len(self) -> int:
+        return self._array.shape[0]
+
+    def col_len(self) -> int:
+        return self._array.shape[1]
+
+    @overload
+    def __getitem__(self, __key: SupportsIndex) -> Array:
+        ...
+
+    @overload
+    def __getitem__(self, __key: tuple[int, int]) -> T:
+        ...
+
+    def __getitem__(self, __key: SupportsIndex | tuple[int, int]) -> Array | T:
+        if isinstance(__key, tuple):
+            x, y = __key
+            return self._array[y, x]
+        return self._array[__key]
+
+    def __len__(self) -> int:
+        return self._array.shape[0]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ArrayGrid):
+            return NotImplemented
+        return np.array_equal(self._array, other._array)
+
+    def __hash__(self) -> int:
+        return hash((self._array.shape, self._array.dtype.str, self._array.tobytes()))
+
+    @classmethod
+    def from_iter(cls, grid: Iterable[Iterable[T]], /) -> ArrayGrid[T]:
+        return cls(np.array([list(row) for row in grid]))
+
+    @overload
+    @classmethod
+    def from_str(cls, s: str) -> ArrayGrid[str]:
+        ...
+
+    @overload
+    @classmethod
+    def from_str(cls, s: str, p: Callable[[str], T]) -> ArrayGrid[T]:
+        ...
+
+    @classmethod
+    def from_str(cls, s: str, p: Callable[[str], T] | None = None) -> ArrayGrid[T] | ArrayGrid[str]:
+        """
+        Parse a rectangular grid of characters. The parser `p` is only
+        called once per distinct character.
+        """
+        s = s.rstrip("\n")
+        width = s.find("\n")
+        if width == -1:
+            width = len(s)
+        elif width == 0:
+            raise ValueError("grid starts with an empty row")
+
+        chars = np.frombuffer(f"{s}\n".encode("utf-32-le"), dtype="<U1")
+        try:
+            chars = chars.reshape(-1, width + 1)[:, :width]
+        except ValueError:
+            raise ValueError("grid rows are not all the same length") from None
+
+        if p is None:
+            return cls(chars)
+
+        unique, inverse = np.unique(chars, return_inverse=True)
+        values = np.array([p(str(c)) for c in unique])
+        return cls(values[inverse].reshape(chars.shape))
+
+    def __repr__(self) -> str:
+        return '\n'.join("".join(str(c) for c in row) for row in self._array)
+
+    def transpose(self) -> ArrayGrid[T]:
+        return ArrayGrid(self._array.T)
+
+    def rotate(self, turns: int) -> ArrayGrid[T]:
+        """rotate grid by 90° turns, +/- turns corresponds to ccw/cw rotation"""
+        return ArrayGrid(np.rot90(self._array, turns))
+
+    def hreflect(self) -> ArrayGrid[T]:
+        return ArrayGrid(self._array[:, ::-1])
+
+    def vreflect(self) -> ArrayGrid[T]:
+        return ArrayGrid(self._array[::-1])
+
+    def in_bounds(self, p: Point) -> bool:
+        return 0 <= p.x < self.col_len() and 0 <= p.y < self.row_len()
+
+    def on_edge(self, p: Point) -> bool:
+        return (
+            p.y <= 0
+            or p.x <= 0
+            or p.y >= self.row_len() - 1
+            or p.x >= self.col_len() - 1
+        )
+
+    def find(self, t: T, /) -> Point:
+        found = np.argwhere(self._array == t)
+        if not len(found):
+            raise ValueError(f"value {t!r} not located in grid")
+        y, x = found[0]
+        return Point(int(x), int(y))
+
+    def find_all(self, t: T, /) -> list[Point]:
+        return [Point(int(x), int(y)) for y, x in np.argwhere(self._array == t)]
+
+
+__all__ = [
+    "ArrayGrid",
+]
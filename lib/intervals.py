@@ -0,0 +1,528 @@
+from __future__ import annotations
+
+import bisect
+from collections import Counter
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Mapping
+from collections.abc import Sequence
+from itertools import chain
+from typing import Any
+from typing import final
+from typing import Literal
+
+import numpy as np
+import numpy.typing as npt
+
+
+type Interval = tuple[int, int]
+"""Half-open integer interval (start, stop), like range(start, stop)"""
+
+
+@final
+class IntervalSet:
+    """
+    Immutable set of integers stored as sorted, disjoint, non-adjacent
+    half-open intervals. Set operations sweep both interval lists at once,
+    so they cost O(n + m) in the number of intervals, not their widths.
+    """
+    __slots__ = ("_intervals",)
+
+    def __init__(self, intervals: Iterable[Interval] = (), /) -> None:
+        merged: list[Interval] = []
+        for start, stop in sorted(intervals):
+            if start >= stop:
+                continue
+            if merged and start <= merged[-1][1]:
+                if stop > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], stop)
+            else:
+                merged.append((start, stop))
+        self._intervals = tuple(merged)
+
+    @classmethod
+    def _from_normalized(cls, intervals: Iterable[Interval]) -> IntervalSet:
+        interval_set = cls.__new__(cls)
+        interval_set._intervals = tuple(intervals)
+        return interval_set
+
+    @property
+    def intervals(self) -> tuple[Interval, ...]:
+        return self._intervals
+
+    @property
+    def size(self) -> int:
+        """number of integers in the set"""
+        return sum(stop - start for start, stop in self._intervals)
+
+    def min(self) -> int:
+        if not self._intervals:
+            raise ValueError("min of empty IntervalSet")
+        return self._intervals[0][0]
+
+    def max(self) -> int:
+        if not self._intervals:
+            raise ValueError("max of empty IntervalSet")
+        return self._intervals[-1][1] - 1
+
+    def __iter__(self) -> Iterator[Interval]:
+        return iter(self._intervals)
+
+    def __len__(self) -> int:
+        """number of intervals"""
+        return len(self._intervals)
+
+    def __bool__(self) -> bool:
+        return bool(self._intervals)
+
+    def __contains__(self, x: int) -> bool:
+        i = bisect.bisect_right(self._intervals, (x, _INF))
+        return i > 0 and x < self._intervals[i - 1][1]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self._intervals == other._intervals
+
+    def __hash__(self) -> int:
+        return hash(self._intervals)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._intervals)})"
+
+    def union(self, other: IntervalSet) -> IntervalSet:
+        return IntervalSet(chain(self._intervals, other._intervals))
+
+    def intersection(self, other: IntervalSet) -> IntervalSet:
+        a, b = self._intervals, other._intervals
+        result = []
+        i = j = 0
+        while i < len(a) and j < len(b):
+            start = max(a[i][0], b[j][0])
+            stop = min(a[i][1], b[j][1])
+            if start < stop:
+                result.append((start, stop))
+            if a[i][1] < b[j][1]:
+                i += 1
+            else:
+                j += 1
+        return IntervalSet._from_normalized(result)
+
+    def difference(self, other: IntervalSet) -> IntervalSet:
+        b = other._intervals
+        result = []
+        j = 0
+        for start, stop in self._intervals:
+            # skip intervals of other that end before this one starts
+            while j < len(b) and b[j][1] <= start:
+                j += 1
+            k = j
+            while k < len(b) and b[k][0] < stop:
+                if b[k][0] > start:
+                    result.append((start, b[k][0]))
+                start = max(start, b[k][1])
+                k += 1
+            if start < stop:
+                result.append((start, stop))
+        return IntervalSet._from_normalized(result)
+
+    def shift(self, offset: int) -> IntervalSet:
+        return IntervalSet._from_normalized(
+            (start + offset, stop + offset) for start, stop in self._intervals
+        )
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+
+@final
+class PiecewiseMap:
+    """
+    Map of the integers onto themselves that adds a constant offset per
+    piece, e.g., an almanac map of (source range, destination start) entries.
+    Integers outside of all pieces map to themselves.
+
+    Stored as sorted breakpoints with the offset applying up to (and
+    excluding) each breakpoint, so lookups are a bisection, and chains of
+    maps can be composed with `then` into a single map up front.
+    """
+    __slots__ = ("_bounds", "_offsets")
+
+    def __init__(self, pieces: Iterable[tuple[int, int, int]] = (), /) -> None:
+        """pieces are (start, stop, offset) and must not overlap"""
+        bounds: list[int] = []
+        offsets: list[int] = [0]
+        for start, stop, offset in sorted(pieces):
+            if start >= stop:
+                continue
+            if bounds and start < bounds[-1]:
+                raise ValueError(f"overlapping piece starting at {start}")
+            if bounds and start == bounds[-1]:
+                offsets[-1] = offset
+            else:
+                bounds.append(start)
+                offsets.append(offset)
+            bounds.append(stop)
+            offsets.append(0)
+        self._bounds, self._offsets = _simplify(bounds, offsets)
+
+    @classmethod
+    def _from_breaks(cls, bounds: list[int], offsets: list[int]) -> PiecewiseMap:
+        m = cls.__new__(cls)
+        m._bounds, m._offsets = _simplify(bounds, offsets)
+        return m
+
+    @property
+    def pieces(self) -> list[tuple[int, int, int]]:
+        """the (start, stop, offset) pieces with a non-zero offset"""
+        return [
+            (self._bounds[i - 1], self._bounds[i], offset)
+            for i, offset in enumerate(self._offsets)
+            if offset and 0 < i < len(self._bounds)
+        ]
+
+    def offset(self, x: int) -> int:
+        return self._offsets[bisect.bisect_right(self._bounds, x)]
+
+    def __call__(self, x: int) -> int:
+        return x + self._offsets[bisect.bisect_right(self._bounds, x)]
+
+    def __len__(self) -> int:
+        """number of pieces, including the unbounded ones at either end"""
+        return len(self._offsets)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PiecewiseMap):
+            return NotImplemented
+        return self._bounds == other._bounds and self._offsets == other._offsets
+
+    def __hash__(self) -> int:
+        return hash((self._bounds, self._offsets))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.pieces})"
+
+    def image(self, intervals: IntervalSet) -> IntervalSet:
+        """the set of values the integers in `intervals` map to"""
+        bounds, offsets = self._bounds, self._offsets
+        mapped = []
+        for start, stop in intervals:
+            i = bisect.bisect_right(bounds, start)
+            while i < len(bounds) and bounds[i] < stop:
+                mapped.append((start + offsets[i], bounds[i] + offsets[i]))
+                start = bounds[i]
+                i += 1
+            mapped.append((start + offsets[i], stop + offsets[i]))
+        return IntervalSet(mapped)
+
+    def then(self, other: PiecewiseMap) -> PiecewiseMap:
+        """the composed map `x -> other(self(x))`"""
+        # breakpoints of the composition are those of self plus the
+        # preimages of other's breakpoints under each piece of self
+        breaks = set(self._bounds)
+        edges = (-_INF, *self._bounds, _INF)
+        for i, offset in enumerate(self._offsets):
+            lo = bisect.bisect_right(other._bounds, edges[i] + offset)
+            hi = bisect.bisect_left(other._bounds, edges[i + 1] + offset)
+            breaks.update(b - offset for b in other._bounds[lo:hi])
+
+        bounds = sorted(breaks)
+        samples = [bounds[0] - 1, *bounds] if bounds else [0]
+        offsets = [self.offset(x) + other.offset(self(x)) for x in samples]
+        return PiecewiseMap._from_breaks(bounds, offsets)
+
+    __rshift__ = then
+
+
+@final
+class Box:
+    """
+    Immutable n-dimensional box of integer points, the product of one
+    half-open (start, stop) interval per dimension.
+    """
+    __slots__ = ("_bounds",)
+
+    def __init__(self, bounds: Iterable[Interval], /) -> None:
+        self._bounds = tuple((start, stop) for start, stop in bounds)
+
+    @property
+    def bounds(self) -> tuple[Interval, ...]:
+        return self._bounds
+
+    @property
+    def volume(self) -> int:
+        """number of points in the box"""
+        volume = 1
+        for start, stop in self._bounds:
+            if stop <= start:
+                return 0
+            volume *= stop - start
+        return volume
+
+    def __bool__(self) -> bool:
+        return all(start < stop for start, stop in self._bounds)
+
+    def __len__(self) -> int:
+        """number of dimensions"""
+        return len(self._bounds)
+
+    def __contains__(self, point: Iterable[int]) -> bool:
+        return all(
+            start <= x < stop
+            for x, (start, stop) in zip(point, self._bounds, strict=True)
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Box):
+            return NotImplemented
+        if not self or not other:
+            return not self and not other
+        return self._bounds == other._bounds
+
+    def __hash__(self) -> int:
+        return hash(self._bounds) if self else 0
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._bounds)})"
+
+    def split(self, dim: int, threshold: int) -> tuple[Box, Box]:
+        """
+        split into the points with coordinate `dim` below `threshold` and
+        those at or above it, either may be empty
+        """
+        start, stop = self._bounds[dim]
+        below = list(self._bounds)
+        above = list(self._bounds)
+        below[dim] = (start, min(stop, threshold))
+        above[dim] = (max(start, threshold), stop)
+        return Box(below), Box(above)
+
+    def intersection(self, other: Box) -> Box:
+        return Box(
+            (max(a_start, b_start), min(a_stop, b_stop))
+            for (a_start, a_stop), (b_start, b_stop)
+            in zip(self._bounds, other._bounds, strict=True)
+        )
+
+    def difference(self, other: Box) -> list[Box]:
+        """disjoint boxes covering the points of self not in other"""
+        if not self.intersection(other):
+            return [self] if self else []
+
+        pieces = []
+        rest = self
+        for dim, (start, stop) in enumerate(other._bounds):
+            below, rest = rest.split(dim, start)
+            rest, above = rest.split(dim, stop)
+            pieces.extend(box for box in (below, above) if box)
+        return pieces
+
+    __and__ = intersection
+
+
+def disjoint_union(boxes: Iterable[Box]) -> list[Box]:
+    """disjoint boxes covering the same points as the union of `boxes`"""
+    disjoint: list[Box] = []
+    for box in boxes:
+        pieces = [box] if box else []
+        for existing in disjoint:
+            pieces = [p for piece in pieces for p in piece.difference(existing)]
+        disjoint.extend(pieces)
+    return disjoint
+
+
+type Rule = tuple[int, Literal["<", ">"], int, str]
+"""(dimension, comparison, value, target), e.g., x > 10 -> target"""
+
+
+@final
+class DecisionTable:
+    """
+    Rule lists compiled into a flat table of threshold tests. Row `i` is
+    `(dim, threshold, below, above)`: points with coordinate `dim` below
+    `threshold` continue at row `below`, the others at row `above`. Negative
+    row ids `~k` end evaluation with outcome `outcomes[k]`.
+
+    Workflows reference each other and the outcomes by name, are compiled
+    once, and evaluated by a loop over the table, rather than by walking
+    the rule objects.
+    """
+    __slots__ = ("rows", "root", "outcomes")
+
+    def __init__(
+        self,
+        rows: Sequence[tuple[int, int, int, int]],
+        root: int,
+        outcomes: Sequence[str],
+    ) -> None:
+        self.rows = tuple(rows)
+        self.root = root
+        self.outcomes = tuple(outcomes)
+
+    @classmethod
+    def compile(
+        cls,
+        workflows: Mapping[str, tuple[Sequence[Rule], str]],
+        root: str,
+    ) -> DecisionTable:
+        """
+        Compile `workflows`, mapping each name to its conditional rules and
+        fallback target, starting at workflow `root`. Every target that is
+        not a workflow is an outcome.
+        """
+        first_row: dict[str, int] = {}
+        count = 0
+        for name, (rules, _) in workflows.items():
+            first_row[name] = count
+            count += len(rules)
+
+        outcomes: dict[str, int] = {}
+
+        def resolve(target: str, seen: tuple[str, ...] = ()) -> int:
+            if target not in workflows:
+                return ~outcomes.setdefault(target, len(outcomes))
+            rules, fallback = workflows[target]
+            if rules:
+                return first_row[target]
+            if target in seen:
+                raise ValueError(f"workflows loop without conditions: {seen}")
+            return resolve(fallback, (*seen, target))
+
+        rows = []
+        for name, (rules, fallback) in workflows.items():
+            for i, (dim, op, value, target) in enumerate(rules):
+                passed = resolve(target)
+                failed = first_row[name] + i + 1 if i + 1 < len(rules) else resolve(fallback)
+                if op == "<":
+                    rows.append((dim, value, passed, failed))
+                elif op == ">":
+                    rows.append((dim, value + 1, failed, passed))
+                else:
+                    raise ValueError(f"unsupported comparison: {op!r}")
+
+        # outcomes are numbered in insertion order, which the keys keep
+        return cls(rows, resolve(root), tuple(outcomes))
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def evaluate(self, point: Sequence[int]) -> str:
+        rows = self.rows
+        row = self.root
+        while row >= 0:
+            dim, threshold, below, above = rows[row]
+            row = below if point[dim] < threshold else above
+        return self.outcomes[~row]
+
+    def to_function(self) -> Callable[[Sequence[int]], str]:
+        """
+        Generate and compile python source evaluating the table as nested
+        `if` statements on `point[dim]`, equivalent to `evaluate`. Rows
+        reached from more than one place become functions of their own.
+        """
+        if self.root < 0:
+            outcome = self.outcomes[~self.root]
+            return lambda _: outcome
+
+        references = Counter(
+            target for _, _, below, above in self.rows for target in (below, above)
+        )
+        functions = [self.root]
+        defined = set(functions)
+        lines: list[str] = []
+
+        def emit(row: int, indent: int, inlined: int) -> None:
+            if row < 0:
+                lines.append(f"{'    ' * indent}return _outcome{~row}")
+                return
+
+            dim, threshold, below, above = self.rows[row]
+            lines.append(f"{'    ' * indent}if p[{dim}] < {threshold}:")
+            branch(below, indent + 1, inlined + 1)
+            branch(above, indent, inlined + 1)
+
+        def branch(row: int, indent: int, inlined: int) -> None:
+            # shared rows, and long inlined chains, are called instead
+            if row >= 0 and (references[row] > 1 or inlined > _MAX_INLINED_ROWS):
+                if row not in defined:
+                    defined.add(row)
+                    functions.append(row)
+                lines.append(f"{'    ' * indent}return _row{row}(p)")
+            else:
+                emit(row, indent, inlined)
+
+        # functions grows while rows are emitted
+        for row in functions:
+            lines.append(f"def _row{row}(p):")
+            emit(row, 1, 0)
+
+        namespace: dict[str, Any] = {
+            f"_outcome{k}": outcome for k, outcome in enumerate(self.outcomes)
+        }
+        exec(compile("\n".join(lines), "<DecisionTable>", "exec"), namespace)
+        return namespace[f"_row{self.root}"]
+
+    def classify(self, points: npt.ArrayLike) -> npt.NDArray[np.intp]:
+        """
+        Outcome index into `outcomes` for each point of a 2d array with one
+        point per row, evaluating all points a table row at a time.
+        """
+        points = np.asarray(points)
+        table = np.array(self.rows, dtype=np.int64).reshape(-1, 4)
+        dims, thresholds, below, above = table.T
+
+        current = np.full(len(points), self.root, dtype=np.intp)
+        active = np.flatnonzero(current >= 0)
+        while len(active):
+            rows = current[active]
+            values = points[active, dims[rows]]
+            current[active] = np.where(values < thresholds[rows], below[rows], above[rows])
+            active = active[current[active] >= 0]
+        return ~current
+
+    def partition(self, box: Box) -> dict[str, list[Box]]:
+        """split `box` into disjoint boxes by the outcome of their points"""
+        partitions: dict[str, list[Box]] = {outcome: [] for outcome in self.outcomes}
+        rows = self.rows
+        stack = [(self.root, box)]
+        while stack:
+            row, box = stack.pop()
+            if row < 0:
+                partitions[self.outcomes[~row]].append(box)
+                continue
+
+            dim, threshold, below, above = rows[row]
+            low, high = box.split(dim, threshold)
+            if low:
+                stack.append((below, low))
+            if high:
+                stack.append((above, high))
+        return partitions
+
+
+_INF = float("inf")
+_MAX_INLINED_ROWS = 50
+
+
+def _simplify(bounds: list[int], offsets: list[int]) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """drop breakpoints with the same offset on both sides"""
+    kept_bounds: list[int] = []
+    kept_offsets = [offsets[0]]
+    for bound, offset in zip(bounds, offsets[1:], strict=True):
+        if offset != kept_offsets[-1]:
+            kept_bounds.append(bound)
+            kept_offsets.append(offset)
+    return tuple(kept_bounds), tuple(kept_offsets)
+
+
+__all__ = [
+    "Box",
+    "DecisionTable",
+    "disjoint_union",
+    "Interval",
+    "IntervalSet",
+    "PiecewiseMap",
+    "Rule",
+]
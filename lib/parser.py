@@ -127,11 +127,32 @@ class Point(NamedTuple):
     x: int = 0
     y: int = 0
 
+    # `__add__` and `__sub__` are the hot path of most grid walks, so they
+    # are special cased on the operand type and construct the result through
+    # `tuple.__new__` directly, skipping the generated `NamedTuple.__new__`
     def __add__(self, other: tuple[int, int] | int) -> Point:
-        return _point_operation(self, other, operator.add, "+")
+        sx, sy = self
+        if isinstance(other, tuple):
+            try:
+                ox, oy = other
+                return _new_point(Point, (sx + ox, sy + oy))
+            except (ValueError, TypeError):
+                pass
+        elif isinstance(other, (int, float)):
+            return _new_point(Point, (sx + other, sy + other))
+        return _unpacked_point_operation(self, other, operator.add, "+")
 
     def __sub__(self, other: tuple[int, int] | int) -> Point:
-        return _point_operation(self, other, operator.sub, "-")
+        sx, sy = self
+        if isinstance(other, tuple):
+            try:
+                ox, oy = other
+                return _new_point(Point, (sx - ox, sy - oy))
+            except (ValueError, TypeError):
+                pass
+        elif isinstance(other, (int, float)):
+            return _new_point(Point, (sx - other, sy - other))
+        return _unpacked_point_operation(self, other, operator.sub, "-")
 
     def __mul__(self, other: tuple[int, int] | int) -> Point:
         return _point_operation(self, other, operator.mul, "*")
@@ -151,13 +172,44 @@ class Point(NamedTuple):
         return bool(dx or dy) and abs(dx) <= 1 and abs(dy) <= 1
 
     def iter_neighbors(self, diagonals: bool = True) -> Iterator[Point]:
-        for dx in (-1, 0, 1):
-            for dy in (-1, 0, 1):
-                if not diagonals and abs(dx) == abs(dy) == 1:
-                    continue
-                if dx == dy == 0:
-                    continue
-                yield self + (dx, dy)
+        sx, sy = self
+        for dx, dy in NEIGHBORS8 if diagonals else NEIGHBORS4:
+            yield _new_point(Point, (sx + dx, sy + dy))
+
+    def pack(self) -> int:
+        """
+        Encode as a single int, `y * 2**32 + x`. The encoding is linear so
+        packed points can be added/subtracted directly, valid as long as both
+        coordinates (and those of any sums) are within a signed 32 bit range.
+        """
+        return (self.y << 32) + self.x
+
+    @classmethod
+    def unpack(cls, packed: int, /) -> Point:
+        x = ((packed + _PACK_HALF) & _PACK_MASK) - _PACK_HALF
+        return _new_point(cls, (x, (packed - x) >> 32))
+
+
+_new_point = tuple.__new__
+_PACK_MASK = 2**32 - 1
+_PACK_HALF = 2**31
+
+UP = Point(0, -1)
+DOWN = Point(0, 1)
+LEFT = Point(-1, 0)
+RIGHT = Point(1, 0)
+NEIGHBORS4 = (LEFT, UP, DOWN, RIGHT)
+NEIGHBORS8 = (
+    Point(-1, -1),
+    LEFT,
+    Point(-1, 1),
+    UP,
+    DOWN,
+    Point(1, -1),
+    RIGHT,
+    Point(1, 1),
+)
+
 
 def _point_operation(
     point: Point,
@@ -165,21 +217,43 @@ def _point_operation(
     operation: Callable[[int, int], int],
     symbol: str,
 ) -> Point:
+    if isinstance(other, tuple):
+        try:
+            x, y = other
+            return _new_point(Point, (operation(point.x, x), operation(point.y, y)))
+        except (ValueError, TypeError):
+            pass
+    elif isinstance(other, (int, float)):
+        return _new_point(Point, (operation(point.x, other), operation(point.y, other)))  # type: ignore[arg-type]
+    return _unpacked_point_operation(point, other, operation, symbol)
+
+
+def _unpacked_point_operation(
+    point: Point,
+    other: object,
+    operation: Callable[[int, int], int],
+    symbol: str,
+) -> Point:
+    # the generic path for operands other than tuples and scalars, e.g.,
+    # lists or numpy arrays: unpack as a pair if possible, else a scalar
     x: int
     y: int
     try:
         x, y = other  # type: ignore
     except (ValueError, TypeError):
-        x, y = other, other # type: ignore
+        x, y = other, other  # type: ignore
 
     try:
         return Point(operation(point.x, x), operation(point.y, y))
     except TypeError:
-        raise TypeError(
-            f"unsupported operand type(s) for {symbol}:"
-            f" {type(point).__name__!r} and {type(other).__name__!r}"
-        )
+        raise _unsupported_operand(point, other, symbol) from None
+
 
+def _unsupported_operand(point: Point, other: object, symbol: str) -> TypeError:
+    return TypeError(
+        f"unsupported operand type(s) for {symbol}:"
+        f" {type(point).__name__!r} and {type(other).__name__!r}"
+    )
 
 
 @final
@@ -307,10 +381,210 @@ class FrozenGrid[T](Sequence[Sequence[T]]):
         raise ValueError(f"value {t!r} not located in grid")
 
 
+@final
+@dataclass(frozen=True)
+class FlatGrid:
+    """
+    Grid of characters stored row major in a flat `bytes` buffer and
+    surrounded by a one cell border of `sentinel`. Cells are addressed by a
+    single int, `index = y * width + x`, in padded coordinates, so neighbors
+    are found by adding one of the precomputed `offsets4`/`offsets8` and
+    walks can stop on the sentinel rather than checking bounds.
+    """
+    cells: bytes
+    width: int
+    height: int
+    sentinel: int
+
+    @classmethod
+    def from_str(cls, s: str, sentinel: str = "#") -> FlatGrid:
+        rows = s.splitlines()
+        if not rows:
+            raise ValueError("grid is empty")
+
+        cols = len(rows[0])
+        if any(len(row) != cols for row in rows):
+            raise ValueError("grid rows are not all the same length")
+
+        width = cols + 2
+        border = sentinel * width
+        padded = "".join([border, *(f"{sentinel}{row}{sentinel}" for row in rows), border])
+        return cls(padded.encode("latin-1"), width, len(rows) + 2, ord(sentinel))
+
+    @property
+    def offsets4(self) -> tuple[int, int, int, int]:
+        """up, right, down, left"""
+        w = self.width
+        return (-w, 1, w, -1)
+
+    @property
+    def offsets8(self) -> tuple[int, int, int, int, int, int, int, int]:
+        """clockwise starting from up"""
+        w = self.width
+        return (-w, -w + 1, 1, w + 1, w, w - 1, -1, -w - 1)
+
+    def row_len(self) -> int:
+        """number of (unpadded) rows"""
+        return self.height - 2
+
+    def col_len(self) -> int:
+        """number of (unpadded) columns"""
+        return self.width - 2
+
+    def index(self, p: tuple[int, int], /) -> int:
+        """flat index of an unpadded point"""
+        return (p[1] + 1) * self.width + p[0] + 1
+
+    def point(self, index: int, /) -> Point:
+        """unpadded point of a flat index"""
+        y, x = divmod(index, self.width)
+        return Point(x - 1, y - 1)
+
+    def __getitem__(self, index: int, /) -> str:
+        return chr(self.cells[index])
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def is_sentinel(self, index: int, /) -> bool:
+        return self.cells[index] == self.sentinel
+
+    def in_bounds(self, index: int, /) -> bool:
+        """whether index lies within the unpadded grid"""
+        y, x = divmod(index, self.width)
+        return 0 < y < self.height - 1 and 0 < x < self.width - 1
+
+    def iter_indices(self) -> Iterator[int]:
+        """flat indices of all unpadded cells"""
+        w = self.width
+        for y in range(1, self.height - 1):
+            yield from range(y * w + 1, y * w + w - 1)
+
+    def find(self, t: str, /) -> int:
+        index = self.cells.find(t.encode("latin-1"), self.width)
+        if index == -1 or index >= len(self.cells) - self.width:
+            raise ValueError(f"value {t!r} not located in grid")
+        return index
+
+    def __repr__(self) -> str:
+        w = self.width
+        return "\n".join(
+            self.cells[y * w + 1:y * w + w - 1].decode("latin-1")
+            for y in range(1, self.height - 1)
+        )
+
+
+@final
+@dataclass(frozen=True)
+class BitBoard:
+    """
+    Bitboard of a grid: a set of cells is a single int with bit
+    `y * stride + x` for cell (x, y), where `stride = width + 1` leaves a
+    padding column between rows. `open` holds the cells that are not walls.
+
+    Objects rolling on the board, e.g., round rocks, are kept as a separate
+    int mask and moved by `tilt`, which shifts all of them at once.
+    """
+    width: int
+    height: int
+    open: int
+
+    @classmethod
+    def from_str(cls, s: str, wall: str = "#") -> BitBoard:
+        rows = s.splitlines()
+        if not rows:
+            raise ValueError("grid is empty")
+
+        width = len(rows[0])
+        if any(len(row) != width for row in rows):
+            raise ValueError("grid rows are not all the same length")
+
+        return cls(width, len(rows), _padded_bits(rows, lambda c: c != wall))
+
+    @property
+    def stride(self) -> int:
+        return self.width + 1
+
+    def row_len(self) -> int:
+        return self.height
+
+    def col_len(self) -> int:
+        return self.width
+
+    def mask(self, s: str, predicate: Callable[[str], bool], /) -> int:
+        """bits of the cells of grid string `s` whose character satisfies predicate"""
+        return _padded_bits(s.splitlines(), predicate)
+
+    def bit(self, p: tuple[int, int], /) -> int:
+        return 1 << (p[1] * self.stride + p[0])
+
+    def points(self, mask: int, /) -> Iterator[Point]:
+        """the cells of mask in row major order"""
+        stride = self.stride
+        while mask:
+            low = mask & -mask
+            y, x = divmod(low.bit_length() - 1, stride)
+            yield Point(x, y)
+            mask ^= low
+
+    def row_counts(self, mask: int, /) -> list[int]:
+        """number of cells of mask in each row"""
+        stride = self.stride
+        row = (1 << self.width) - 1
+        return [(mask >> (y * stride) & row).bit_count() for y in range(self.height)]
+
+    def tilt(self, mask: int, direction: tuple[int, int], /) -> int:
+        """
+        Roll the cells of mask in `direction`, e.g., `UP`, until they are
+        stopped by a wall, the edge or another rolled cell. Each round moves
+        every cell that can move by one step, so the cost is a few int
+        operations per step of the longest roll.
+        """
+        shift = direction[1] * self.stride + direction[0]
+        open_ = self.open
+        if shift < 0:
+            shift = -shift
+            while moving := mask & ((open_ & ~mask) << shift):
+                mask ^= moving | moving >> shift
+        else:
+            while moving := mask & ((open_ & ~mask) >> shift):
+                mask ^= moving | moving << shift
+        return mask
+
+    def to_str(self, mask: int, /, wall: str = "#", filled: str = "O", empty: str = ".") -> str:
+        stride = self.stride
+        return "\n".join(
+            "".join(
+                filled if mask >> (i := y * stride + x) & 1
+                else empty if self.open >> i & 1
+                else wall
+                for x in range(self.width)
+            )
+            for y in range(self.height)
+        )
+
+
+def _padded_bits(rows: Sequence[str], predicate: Callable[[str], bool]) -> int:
+    # reversed, as the first character is the least significant bit
+    bits = "".join(
+        "0" + "".join("1" if predicate(c) else "0" for c in reversed(row))
+        for row in reversed(rows)
+    )
+    return int(bits, 2) if bits else 0
+
+
 __all__ = [
+    "BitBoard",
     "collect_lines",
     "collect_block_lines",
     "collect_block_statements",
     "Point",
+    "UP",
+    "DOWN",
+    "LEFT",
+    "RIGHT",
+    "NEIGHBORS4",
+    "NEIGHBORS8",
     "FrozenGrid",
+    "FlatGrid",
 ]
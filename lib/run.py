@@ -1,14 +1,43 @@
+from __future__ import annotations
+
+import cProfile
+import csv
+import json
+import math
+import multiprocessing
+import os
+import pstats
+import resource
+import statistics
+import sys
 import time
+import tomllib
+import tracemalloc
 from argparse import ArgumentParser
 from collections.abc import Callable
+from collections.abc import Mapping
 from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from contextlib import redirect_stdout
 from dataclasses import dataclass
-
+from dataclasses import field
+from functools import partial
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Any
+from typing import Literal
+from typing import TextIO
+
+from . import _history
 from ._helpers import Color
 from ._helpers import DayPart
 from ._helpers import get_all_dayparts
+from ._helpers import get_rootdir
 from ._helpers import get_selections
+from ._helpers import HandledError
 from ._helpers import SelectionArgs
+from ._history import HISTORY_FILENAME
 
 
 def main(argv: Sequence[str] | None = None) -> int:
@@ -22,7 +51,121 @@ def main(argv: Sequence[str] | None = None) -> int:
     parser.add_argument("--days", type=int, action="append")
     parser.add_argument("--parts", type=int, action="append")
     parser.add_argument("--test", default=False, action="store_true")
-    parser.add_argument("--count", type=int, default=1)
+    parser.add_argument(
+        "--count",
+        type=int,
+        default=1,
+        help="(minimum) number of timed executions of each solution",
+    )
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=0,
+        help="number of untimed executions before sampling begins",
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=None,
+        help=(
+            "time budget in seconds, keep sampling beyond --count until the"
+            " confidence interval of the mean is within --rtol or the budget"
+            " is exhausted"
+        ),
+    )
+    parser.add_argument(
+        "--rtol",
+        type=float,
+        default=0.02,
+        help="target relative half-width of the 95%% confidence interval",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        nargs="?",
+        const=os.cpu_count() or 1,
+        default=1,
+        help="number of worker processes, defaults to one per core if no value is given",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        help=(
+            "wall-clock limit in seconds for executing each day/part (including"
+            " all samples), solutions exceeding it are killed"
+        ),
+    )
+    parser.add_argument(
+        "--timeouts",
+        metavar="FILE",
+        type=Path,
+        default=None,
+        help=(
+            'toml table of per day/part timeouts overriding --timeout, e.g.,'
+            ' `"17" = 30` or `"17/2" = 60`'
+        ),
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="N",
+        type=int,
+        nargs="?",
+        const=10,
+        default=None,
+        help=(
+            "profile an additional execution of each solution with cProfile,"
+            " saving the stats next to the solution file and printing the top N"
+            " (default 10) functions by cumulative time"
+        ),
+    )
+    parser.add_argument(
+        "--memory",
+        default=False,
+        action="store_true",
+        help=(
+            "report the peak resident set size while timing each solution and"
+            " the peak traced allocation of an additional tracemalloc execution"
+        ),
+    )
+    parser.add_argument(
+        "--format",
+        choices=("text", "json", "csv"),
+        default="text",
+        help=(
+            "emit one json (lines) or csv record per solution, to --output or"
+            " otherwise stdout, in which case the text output goes to stderr"
+        ),
+    )
+    parser.add_argument(
+        "--output",
+        metavar="FILE",
+        type=Path,
+        default=None,
+        help="file to write json/csv records to",
+    )
+    parser.add_argument(
+        "--no-record",
+        dest="record",
+        default=True,
+        action="store_false",
+        help=f"do not append timings to {HISTORY_FILENAME}",
+    )
+    parser.add_argument(
+        "--compare",
+        metavar="REF",
+        default=None,
+        help=(
+            "compare median durations against those recorded at the git REF,"
+            " exit non-zero if any solution regressed beyond --threshold"
+        ),
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative increase of the median duration considered a regression",
+    )
 
     args, other_args = parser.parse_known_args(argv, namespace=_Args())
     dayparts = get_all_dayparts()
@@ -30,67 +173,451 @@ def main(argv: Sequence[str] | None = None) -> int:
 
     if args.test:
         return _test_selections(selections, other_args)
-    else:
-        return run_selections(selections, count=args.count)
 
-
-def run_selections(selections: list[DayPart], *, count: int = 1) -> int:
+    try:
+        timeouts = load_timeouts(args.timeouts) if args.timeouts else None
+    except HandledError as ex:
+        print("error:", ex)
+        return 1
+
+    with ExitStack() as stack:
+        writer = None
+        if args.format != "text":
+            if args.output is not None:
+                stream = stack.enter_context(args.output.open("w", newline=""))
+            else:
+                stream = sys.stdout
+                stack.enter_context(redirect_stdout(sys.stderr))
+            writer = ResultWriter(args.format, stream)
+
+        try:
+            return run_selections(
+                selections,
+                count=args.count,
+                warmup=args.warmup,
+                budget=args.budget,
+                rtol=args.rtol,
+                jobs=args.jobs,
+                timeout=args.timeout,
+                timeouts=timeouts,
+                profile=args.profile,
+                memory=args.memory,
+                record=args.record,
+                compare=args.compare,
+                threshold=args.threshold,
+                writer=writer,
+            )
+        except HandledError as ex:
+            print("error:", ex)
+            return 1
+
+
+def run_selections(
+    selections: list[DayPart],
+    *,
+    count: int = 1,
+    warmup: int = 0,
+    budget: float | None = None,
+    rtol: float = 0.02,
+    jobs: int = 1,
+    timeout: float | None = None,
+    timeouts: Mapping[DayPart | int, float] | None = None,
+    profile: int | None = None,
+    memory: bool = False,
+    record: bool = False,
+    compare: str | None = None,
+    threshold: float = 0.1,
+    writer: ResultWriter | None = None,
+) -> int:
     if count <= 0:
         raise ValueError(f"count must be positive, provided: {count}")
+    if warmup < 0:
+        raise ValueError(f"warmup must be non-negative, provided: {warmup}")
+    if budget is not None and budget <= 0:
+        raise ValueError(f"budget must be positive, provided: {budget}")
+    if rtol <= 0:
+        raise ValueError(f"rtol must be positive, provided: {rtol}")
+    if jobs <= 0:
+        raise ValueError(f"jobs must be positive, provided: {jobs}")
+    if timeout is not None and timeout <= 0:
+        raise ValueError(f"timeout must be positive, provided: {timeout}")
+    if profile is not None and profile < 0:
+        raise ValueError(f"profile must be non-negative, provided: {profile}")
+    if threshold < 0:
+        raise ValueError(f"threshold must be non-negative, provided: {threshold}")
+    # git state is looked up once per run rather than per day/part
+    head: str | None = None
+    dirty: bool | None = None
+    baseline_commit: str | None = None
+    if record:
+        head = _history.get_commit()
+        dirty = _history.is_dirty()
+    if compare is not None:
+        # also fails early on unknown refs
+        baseline_commit = _history.get_commit(compare)
+
+    runnable = [dp for dp in selections if dp.is_solved() or len(selections) == 1]
+    run = partial(
+        run_daypart,
+        count=count,
+        warmup=warmup,
+        budget=budget,
+        rtol=rtol,
+        profile=profile is not None,
+        memory=memory,
+    )
+    get_timeout = partial(_get_timeout, timeout=timeout, timeouts=timeouts or {})
+    with ExitStack() as stack:
+        if jobs == 1:
+            get_result = lambda dp: run(dp, timeout=get_timeout(dp))
+        else:
+            executor = ProcessPoolExecutor(max_workers=jobs)
+            stack.callback(executor.shutdown, wait=False, cancel_futures=True)
+            futures = {
+                dp: executor.submit(run, dp, timeout=get_timeout(dp))
+                for dp in runnable
+            }
+            get_result = lambda dp: futures[dp].result()
+
+        rtc = 0
+        for dp in selections:
+            print(f"{dp.emoji} ({dp.day:02}/{dp.part}) ➡️ ", end="", flush=True)
+
+            if dp not in runnable:
+                print(f"{Color.YellowText.format("problem is unsolved")} 🤔")
+                continue
+
+            try:
+                solution_result = get_result(dp)
+            except KeyboardInterrupt:
+                # any child processes share our process group and were
+                # interrupted as well, nothing left to wait on
+                print(f"{Color.YellowText.format("solutions cancelled")} 🛑")
+                return 1
 
-    rtc = 0
-    for dp in selections:
-        input = dp.inputfile.read_text()
-        solution = dp.load_solution()
-        print(f"{dp.emoji} ({dp.day:02}/{dp.part}) ➡️ ", end="")
+            correct = None
+            match solution_result:
+                case Cancelled(duration, timed_out=True):
+                    dstr = _format_duration(duration)
+                    print(f"{Color.YellowText.format(f"solution timed out after {dstr}")} ⏰")
+                    rtc |= 1
+
+                case Cancelled(duration):
+                    dstr = _format_duration(duration)
+                    print(f"{Color.YellowText.format(f"solution cancelled after {dstr}")} 🛑")
+                    if writer is not None:
+                        writer.write(dp, solution_result)
+                    return 1
+
+                case Finished(None, _):
+                    print(f"{Color.YellowText.format("no answer provided?!")} 👻")
+                    rtc |= 1
+
+                case Finished(result, duration, samples, peak_memory):
+                    dstr = _format_duration(duration)
+                    mstr = f", {peak_memory}" if peak_memory else ""
+                    if dp.is_solved():
+                        correct = str(result) == dp.solutionfile.read_text()
+                        if correct:
+                            print(f"{Color.GreenText.format(f"{result = :15d}, duration = {dstr:>8s}{mstr}")} ✅")
+                        else:
+                            print(f"{Color.RedText.format(f"{result = :15d}, duration = {dstr:>8s}{mstr}")} ❌")
+                            rtc |= 1
+                    else:
+                        if dp.add_guess(str(result)):
+                            dp.solutionfile.write_text(str(result))
+                            print(f"{Color.BlueText.format(f"{result = }, duration = {dstr}{mstr}")} 🚀")
+                            from .submit import submit_daypart
+                            rtc |= submit_daypart(dp)
+                        else:
+                            print(f"{Color.RedText.format(f"{result = }, duration = {dstr}{mstr}")} ❌")
+                            rtc |= 1
+
+                    if len(samples) > 1:
+                        print(f"    {Stats.from_samples(samples)}")
+
+                    if profile is not None:
+                        _print_hotspots(dp.profilefile, profile)
+
+                    # compare before recording, so that the samples of this
+                    # run are not part of their own baseline
+                    if compare is not None:
+                        comparison = _history.compare(
+                            dp, samples, compare, threshold=threshold, commit=baseline_commit
+                        )
+                        rtc |= _print_comparison(comparison)
+
+                    if record:
+                        _history.append_record(
+                            _history.Record.create(dp, samples, peak_memory, commit=head, dirty=dirty)
+                        )
+
+            if writer is not None:
+                writer.write(dp, solution_result, correct)
 
-        if not dp.is_solved() and len(selections) > 1:
-            print(f"{Color.YellowText.format("problem is unsolved")} 🤔")
-            continue
+    return rtc
 
-        total_time = 0
-        result = None
-        for _ in range(count):
-            result = time_it(solution, input)
-            if isinstance(result, Cancelled):
-                break
 
-            total_time += result.duration
+def run_daypart(
+    dp: DayPart,
+    *,
+    count: int = 1,
+    warmup: int = 0,
+    budget: float | None = None,
+    rtol: float = 0.02,
+    timeout: float | None = None,
+    profile: bool = False,
+    memory: bool = False,
+) -> SolutionResult:
+    """
+    Execute the solution for a single day/part, see `sample_it`. Must remain a
+    module level function so that it can be dispatched to worker processes.
+
+    If a `timeout` (in seconds) is provided the solution is executed in a
+    child process which is killed once the timeout is exceeded.
+
+    If `profile` is set, the solution is executed once more under cProfile
+    and the stats are dumped to `dp.profilefile`.
+
+    If `memory` is set, the peak resident set size while sampling is
+    measured, and the solution is executed once more under tracemalloc to
+    measure its peak traced allocation. The peak resident set size can only
+    be reset on linux, elsewhere it is the peak of the process lifetime.
+    """
+    if timeout is not None:
+        return _run_daypart_in_child(
+            dp,
+            timeout,
+            count=count,
+            warmup=warmup,
+            budget=budget,
+            rtol=rtol,
+            profile=profile,
+            memory=memory,
+        )
+
+    input = dp.inputfile.read_text()
+    solution = dp.load_solution()
+    if memory:
+        _reset_peak_rss()
+    result = sample_it(
+        solution, input, count=count, warmup=warmup, budget=budget, rtol=rtol
+    )
+    if not isinstance(result, Finished):
+        return result
+
+    if memory:
+        peak_rss = _get_peak_rss()
+        _, peak_traced = trace_it(solution, input)
+        result.peak_memory = PeakMemory(rss=peak_rss, traced=peak_traced)
+    if profile:
+        profile_it(solution, input, dp.profilefile)
+    return result
+
+
+def trace_it[R](solution: Callable[[str], R], input: str) -> tuple[R, int]:
+    """
+    Execute solution under tracemalloc, returning the result and the peak
+    traced allocation in bytes
+    """
+    tracemalloc.start()
+    try:
+        result = solution(input)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, peak
 
-        assert result is not None
-        if isinstance(result, Finished):
-            result.duration = total_time // count
 
-        match result:
-            case Cancelled(duration):
-                dstr = _format_duration(duration)
-                print(f"{Color.YellowText.format(f"solution cancelled after {dstr}")} 🛑")
-                return 1
+def _reset_peak_rss() -> None:
+    try:
+        # linux only, see proc(5)
+        Path("/proc/self/clear_refs").write_text("5")
+    except OSError:
+        pass
 
-            case Finished(None, _):
-                print(f"{Color.YellowText.format("no answer provided?!")} 👻")
-                rtc |= 1
 
-            case Finished(result, duration):
-                dstr = _format_duration(duration)
-                if dp.is_solved():
-                    correct = str(result) == dp.solutionfile.read_text()
-                    if correct:
-                        print(f"{Color.GreenText.format(f"{result = :15d}, duration = {dstr:>8s}")} ✅")
-                    else:
-                        print(f"{Color.RedText.format(f"{result = :15d}, duration = {dstr:>8s}")} ❌")
-                        rtc |= 1
-                else:
-                    if dp.add_guess(str(result)):
-                        dp.solutionfile.write_text(str(result))
-                        print(f"{Color.BlueText.format(f"{result = }, duration = {dstr}")} 🚀")
-                        from .submit import submit_daypart
-                        rtc |= submit_daypart(dp)
-                    else:
-                        print(f"{Color.RedText.format(f"{result = }, duration = {dstr}")} ❌")
-                        rtc |= 1
+def _get_peak_rss() -> int:
+    """Peak resident set size in bytes"""
+    try:
+        status = Path("/proc/self/status").read_text()
+    except OSError:
+        pass
+    else:
+        for line in status.splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 1024
+
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # reported in bytes on macOS but kilobytes elsewhere
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+def profile_it[R](solution: Callable[[str], R], input: str, path: Path) -> R:
+    with cProfile.Profile() as profiler:
+        result = solution(input)
+    profiler.dump_stats(path)
+    return result
+
+
+def _print_hotspots(path: Path, top: int) -> None:
+    stats = pstats.Stats(str(path))
+    stats.sort_stats(pstats.SortKey.CUMULATIVE)
+    rootdir = str(get_rootdir()) + os.sep
+    print(f"    {"cumtime":>8s} {"tottime":>8s} {"ncalls":>10s}  function ({path.name})")
+    for func in stats.fcn_list[:top]:  # type: ignore[attr-defined]
+        _, ncalls, tottime, cumtime, _ = stats.stats[func]  # type: ignore[attr-defined]
+        filename, lineno, name = func
+        if filename == "~":
+            location = name
+        else:
+            location = f"{filename.removeprefix(rootdir)}:{lineno}({name})"
+        ctstr = _format_duration(int(cumtime * 1e9))
+        ttstr = _format_duration(int(tottime * 1e9))
+        print(f"    {ctstr:>8s} {ttstr:>8s} {ncalls:>10d}  {location}")
+
+
+def _run_daypart_in_child(
+    dp: DayPart,
+    timeout: float,
+    **kwargs: Any,
+) -> SolutionResult:
+    recv, send = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(
+        target=_daypart_child,
+        args=(send, dp),
+        kwargs=kwargs,
+        daemon=True,
+    )
+    start = time.monotonic_ns()
+    process.start()
+    send.close()
+    try:
+        if not recv.poll(timeout):
+            return Cancelled(time.monotonic_ns() - start, timed_out=True)
+
+        try:
+            result = recv.recv()
+        except EOFError:
+            raise RuntimeError(
+                f"solution process exited unexpectedly: exitcode={process.exitcode}"
+            )
+    finally:
+        if process.is_alive():
+            process.kill()
+        process.join()
+        recv.close()
+
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+
+def _daypart_child(send: Connection, dp: DayPart, **kwargs: Any) -> None:
+    try:
+        result = run_daypart(dp, **kwargs)
+    except Exception as ex:
+        send.send(ex)
+    else:
+        send.send(result)
+    finally:
+        send.close()
 
-    return rtc
+
+def _get_timeout(
+    dp: DayPart,
+    timeout: float | None,
+    timeouts: Mapping[DayPart | int, float],
+) -> float | None:
+    """Lookup order is day/part, day and then the default timeout"""
+    return timeouts.get(dp, timeouts.get(dp.day, timeout))
+
+
+def load_timeouts(path: Path) -> dict[DayPart | int, float]:
+    """
+    Load a toml table of timeouts (in seconds) keyed on either day ("17") or
+    day/part ("17/2").
+    """
+    try:
+        with path.open("rb") as f:
+            table = tomllib.load(f)
+    except (OSError, tomllib.TOMLDecodeError) as ex:
+        raise HandledError(f"failed to load timeouts from {path}: {ex}")
+
+    timeouts: dict[DayPart | int, float] = {}
+    for key, value in table.items():
+        if not isinstance(value, int | float) or value <= 0:
+            raise HandledError(f"invalid timeout for {key!r}: {value!r}")
+
+        day, slash, part = key.partition("/")
+        try:
+            if slash:
+                timeouts[DayPart(int(day), int(part))] = value
+            else:
+                timeouts[int(day)] = value
+        except ValueError:
+            raise HandledError(f"invalid timeout key, expected 'day' or 'day/part': {key!r}")
+
+    return timeouts
+
+
+def sample_it[R](
+    solution: Callable[[str], R],
+    input: str,
+    *,
+    count: int = 1,
+    warmup: int = 0,
+    budget: float | None = None,
+    rtol: float = 0.02,
+) -> SolutionResult[R]:
+    """
+    Time `solution` after `warmup` untimed executions. At least `count`
+    samples are collected, if a `budget` (in seconds) is provided sampling
+    continues until the 95% confidence interval of the mean is within `rtol`
+    of the mean or the budget is exhausted. The resulting duration is the mean
+    of all samples.
+    """
+    for _ in range(warmup):
+        result = time_it(solution, input)
+        if isinstance(result, Cancelled):
+            return result
+
+    budget_ns = int(budget * 1e9) if budget is not None else 0
+    start = time.monotonic_ns()
+    samples: list[int] = []
+    result = None
+    while True:
+        result = time_it(solution, input)
+        if isinstance(result, Cancelled):
+            return result
+
+        samples.append(result.duration)
+        if len(samples) < count:
+            continue
+
+        if not budget_ns or time.monotonic_ns() - start >= budget_ns:
+            break
+
+        if len(samples) > 1 and _ci_halfwidth(samples) <= rtol * statistics.fmean(samples):
+            break
+
+    return Finished(result.result, sum(samples) // len(samples), samples)
+
+
+def _print_comparison(comparison: _history.Comparison) -> int:
+    if comparison.baseline is None:
+        print(f"    {Color.YellowText.format(f"no baseline recorded at {comparison.ref}")} 🤷")
+        return 0
+
+    mstr = _format_duration(int(comparison.median))
+    bstr = _format_duration(int(comparison.baseline))
+    msg = f"median = {mstr} vs {bstr} at {comparison.ref} ({comparison.change:+.1%})"
+    if comparison.regressed:
+        print(f"    {Color.RedText.format(msg)} 🐢")
+        return 1
+    else:
+        print(f"    {Color.GreenText.format(msg)} 🐇")
+        return 0
 
 
 def _test_selections(
@@ -108,10 +635,28 @@ def _test_selections(
 class Finished[R]:
     result: R | None
     duration: int
+    samples: list[int] = field(default_factory=list)
+    peak_memory: PeakMemory | None = None
+
+
+@dataclass(frozen=True)
+class PeakMemory:
+    """
+    Peak memory usage of a solution, in bytes
+    """
+    rss: int
+    traced: int
+
+    def __str__(self) -> str:
+        return (
+            f"peak rss = {_format_bytes(self.rss):>9s},"
+            f" peak alloc = {_format_bytes(self.traced):>9s}"
+        )
 
 @dataclass
 class Cancelled:
     duration: int
+    timed_out: bool = False
 
 type SolutionResult[R] = Finished[R] | Cancelled
 
@@ -131,6 +676,143 @@ def time_it[R, **P](
     return Finished(result, duration)
 
 
+@dataclass(frozen=True)
+class Stats:
+    """
+    Summary statistics of duration samples, in ns
+    """
+    count: int
+    min: int
+    median: int
+    mean: int
+    p95: int
+    stddev: int
+
+    @classmethod
+    def from_samples(cls, samples: Sequence[int]) -> Stats:
+        if not samples:
+            raise ValueError("at least one sample is required")
+
+        if len(samples) > 1:
+            p95 = statistics.quantiles(samples, n=20, method="inclusive")[-1]
+            stddev = statistics.stdev(samples)
+        else:
+            p95 = samples[0]
+            stddev = 0
+
+        return cls(
+            count=len(samples),
+            min=min(samples),
+            median=int(statistics.median(samples)),
+            mean=int(statistics.fmean(samples)),
+            p95=int(p95),
+            stddev=int(stddev),
+        )
+
+    def __str__(self) -> str:
+        return ", ".join(
+            f"{name} = {_format_duration(getattr(self, name))}"
+            for name in ("min", "median", "mean", "p95", "stddev")
+        ) + f", samples = {self.count}"
+
+
+def _ci_halfwidth(samples: Sequence[int]) -> float:
+    """
+    Half-width of the (normal approximation) 95% confidence interval of the
+    mean of samples
+    """
+    return 1.96 * statistics.stdev(samples) / math.sqrt(len(samples))
+
+
+class ResultWriter:
+    """
+    Writes one json (lines) or csv record per executed day/part
+    """
+    FIELDS: tuple[str, ...] = (
+        "day",
+        "part",
+        "result",
+        "correct",
+        "cancelled",
+        "timed_out",
+        "duration_ns",
+        "samples",
+        "min_ns",
+        "median_ns",
+        "mean_ns",
+        "p95_ns",
+        "stddev_ns",
+        "peak_rss",
+        "peak_traced",
+    )
+
+    def __init__(self, format: Literal["json", "csv"], stream: TextIO) -> None:
+        self.format = format
+        self.stream = stream
+        if format == "csv":
+            self._csv_writer = csv.DictWriter(stream, fieldnames=self.FIELDS)
+            self._csv_writer.writeheader()
+        elif format != "json":
+            raise ValueError(f"unsupported format: {format!r}")
+
+    def write(
+        self,
+        dp: DayPart,
+        result: SolutionResult,
+        correct: bool | None = None,
+    ) -> None:
+        record = self.to_record(dp, result, correct)
+        if self.format == "csv":
+            self._csv_writer.writerow(record)
+        else:
+            self.stream.write(json.dumps(record) + "\n")
+        self.stream.flush()
+
+    @classmethod
+    def to_record(
+        cls,
+        dp: DayPart,
+        result: SolutionResult,
+        correct: bool | None = None,
+    ) -> dict[str, Any]:
+        record: dict[str, Any] = dict.fromkeys(cls.FIELDS)
+        record.update(day=dp.day, part=dp.part, duration_ns=result.duration)
+        match result:
+            case Cancelled(_, timed_out):
+                record.update(cancelled=True, timed_out=timed_out)
+
+            case Finished(value, _, samples, peak_memory):
+                record.update(
+                    result=value if value is None else str(value),
+                    correct=correct,
+                    cancelled=False,
+                    timed_out=False,
+                )
+                if samples:
+                    stats = Stats.from_samples(samples)
+                    record.update(
+                        samples=stats.count,
+                        min_ns=stats.min,
+                        median_ns=stats.median,
+                        mean_ns=stats.mean,
+                        p95_ns=stats.p95,
+                        stddev_ns=stats.stddev,
+                    )
+                if peak_memory is not None:
+                    record.update(peak_rss=peak_memory.rss, peak_traced=peak_memory.traced)
+
+        return record
+
+
+def _format_bytes(nbytes: int) -> str:
+    size = float(nbytes)
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
 def _format_duration(duration_ns: int) -> str:
     power = len(str(duration_ns)) - 1
     unit = power // 3
@@ -158,6 +840,19 @@ def _format_duration(duration_ns: int) -> str:
 class _Args(SelectionArgs):
     test: bool = False
     count: int = 1
+    warmup: int = 0
+    budget: float | None = None
+    rtol: float = 0.02
+    jobs: int = 1
+    timeout: float | None = None
+    timeouts: Path | None = None
+    profile: int | None = None
+    memory: bool = False
+    format: Literal["text", "json", "csv"] = "text"
+    output: Path | None = None
+    record: bool = True
+    compare: str | None = None
+    threshold: float = 0.1
 
 
 if __name__ == "__main__":
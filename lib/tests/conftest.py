@@ -8,6 +8,25 @@ import pytest
 from .. import _helpers
 
 
+BENCHMARKS_ENV = "AOC_BENCHMARKS"
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", f"benchmark: timing benchmark, only run when {BENCHMARKS_ENV} is set"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if os.environ.get(BENCHMARKS_ENV):
+        return
+
+    skip = pytest.mark.skip(reason=f"benchmarks only run when {BENCHMARKS_ENV} is set")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
 @pytest.fixture
 def rootdir():
     startingdir = Path.cwd()
@@ -0,0 +1,80 @@
+import pytest
+
+from ..beams import BeamGrid
+from ..parser import DOWN
+from ..parser import LEFT
+from ..parser import Point
+from ..parser import RIGHT
+from ..parser import UP
+
+
+CONTRAPTION = r""".|...\....
+|.-.\.....
+.....|-...
+........|.
+..........
+.........\
+..../.\\..
+.-.-/..|..
+.|....-|.\
+..//.|....
+"""
+
+
+def _energized_naive(s, start, direction):
+    grid = s.splitlines()
+    seen = set()
+    queue = [(start, direction)]
+    while queue:
+        (x, y), (dx, dy) = queue.pop()
+        if not (0 <= y < len(grid) and 0 <= x < len(grid[0])) or ((x, y), (dx, dy)) in seen:
+            continue
+        seen.add(((x, y), (dx, dy)))
+        match grid[y][x]:
+            case "/":
+                dirs = [(-dy, -dx)]
+            case "\\":
+                dirs = [(dy, dx)]
+            case "|" if dx:
+                dirs = [(0, 1), (0, -1)]
+            case "-" if dy:
+                dirs = [(1, 0), (-1, 0)]
+            case _:
+                dirs = [(dx, dy)]
+        queue.extend(((x + ddx, y + ddy), (ddx, ddy)) for ddx, ddy in dirs)
+    return len({p for p, _ in seen})
+
+
+def test_beam_grid_energized():
+    grid = BeamGrid.from_str(CONTRAPTION)
+    assert grid.energized(Point(0, 0), RIGHT) == 46
+    assert grid.energized(Point(3, 0), DOWN) == 51
+
+
+def test_beam_grid_matches_naive():
+    grid = BeamGrid.from_str(CONTRAPTION)
+    entries = list(grid.iter_entries())
+    assert len(entries) == 40
+    for start, direction in entries:
+        assert grid.energized(start, direction) == _energized_naive(CONTRAPTION, start, direction)
+
+
+# a loop through the four mirrors, entered through the splitter
+LOOP = r"""......
+./..\.
+......
+.\-./.
+......
+"""
+
+
+@pytest.mark.parametrize(("start", "direction", "expected"), [
+    (Point(2, 4), UP, 11),
+    (Point(2, 0), DOWN, 12),
+    (Point(0, 1), RIGHT, 3),
+])
+def test_beam_grid_loops(start, direction, expected):
+    s = LOOP
+    grid = BeamGrid.from_str(s)
+    assert grid.energized(start, direction) == _energized_naive(s, start, direction) == expected
+
@@ -0,0 +1,79 @@
+import random
+
+import pytest
+
+from ..bricks import settle_bricks
+
+
+EXAMPLE = [
+    (1, 0, 1, 1, 2, 1),
+    (0, 0, 2, 2, 0, 2),
+    (0, 2, 3, 2, 2, 3),
+    (0, 0, 4, 0, 2, 4),
+    (2, 0, 5, 2, 2, 5),
+    (0, 1, 6, 2, 1, 6),
+    (1, 1, 8, 1, 1, 9),
+]
+
+
+def _settle_cubes(bricks):
+    # reference: drop bricks one unit at a time over a set of occupied cubes
+    occupied: dict[tuple[int, int, int], int] = {}
+    bases, supporters = [], []
+    for i, (x0, y0, z0, x1, y1, z1) in enumerate(bricks):
+        footprint = [(x, y) for x in range(x0, x1 + 1) for y in range(y0, y1 + 1)]
+        z = z0
+        while z > 0 and not any((x, y, z - 1) in occupied for x, y in footprint):
+            z -= 1
+        below = {occupied[x, y, z - 1] for x, y in footprint if (x, y, z - 1) in occupied}
+        for x, y in footprint:
+            for dz in range(z1 - z0 + 1):
+                occupied[x, y, z + dz] = i
+        bases.append(z)
+        supporters.append(sorted(below))
+    return bases, supporters
+
+
+def test_settle_bricks_example():
+    settled = settle_bricks(EXAMPLE)
+    assert settled.bases.tolist() == [0, 1, 1, 2, 2, 3, 4]
+    assert settled.predecessors() == [[], [0], [0], [1, 2], [1, 2], [3, 4], [5]]
+    assert settled.supported_by(5).tolist() == [3, 4]
+    assert settled.sole_supporters().tolist() == [0, 5]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_settle_bricks_random(seed):
+    rng = random.Random(seed)
+    bricks, cubes = [], set()
+    for _ in range(rng.randint(1, 40)):
+        x, y, z = rng.randint(-3, 3), rng.randint(-3, 3), rng.randint(0, 30)
+        dim, length = rng.randrange(3), rng.randint(0, 3)
+        end = [x, y, z]
+        end[dim] += length
+        brick_cubes = set()
+        for step in range(length + 1):
+            cube = [x, y, z]
+            cube[dim] += step
+            brick_cubes.add(tuple(cube))
+        # bricks do not overlap before they fall
+        if not brick_cubes & cubes:
+            cubes |= brick_cubes
+            bricks.append((x, y, z, *end))
+    bricks.sort(key=lambda b: b[2])
+
+    settled = settle_bricks(bricks)
+    bases, supporters = _settle_cubes(bricks)
+    assert settled.bases.tolist() == bases
+    assert settled.predecessors() == supporters
+
+
+def test_settle_bricks_empty():
+    settled = settle_bricks([])
+    assert len(settled) == 0
+    assert settled.predecessors() == []
+
+
+def test_settle_bricks_unsorted():
+    with pytest.raises(ValueError):
+        settle_bricks(EXAMPLE[::-1])
@@ -0,0 +1,33 @@
+import pytest
+
+from ..crucibles import min_heat_loss
+from ..parser import FlatGrid
+
+
+EXAMPLE = """\
+2413432311323
+3215453535623
+3255245654254
+3446585845452
+4546657867536
+1438598798454
+4457876987766
+3637877979653
+4654967986887
+4564679986453
+1224686865563
+2546548887735
+4322674655533
+"""
+
+
+@pytest.mark.parametrize("bucket_queue", [True, False])
+@pytest.mark.parametrize(("straight", "expected"), [((1, 3), 102), ((4, 10), 94)])
+def test_min_heat_loss(straight, expected, bucket_queue):
+    grid = FlatGrid.from_str(EXAMPLE, sentinel="#")
+    assert min_heat_loss(grid, *straight, bucket_queue=bucket_queue) == expected
+
+
+def test_min_heat_loss_invalid_straight():
+    with pytest.raises(ValueError):
+        min_heat_loss(FlatGrid.from_str(EXAMPLE, sentinel="#"), 4, 3)
@@ -0,0 +1,63 @@
+import pytest
+
+from ..cycles import brent
+from ..cycles import Cycle
+from ..cycles import find_cycle
+from ..cycles import nth_state
+
+
+def _rho(offset, period):
+    """step function over ints with a tail of `offset` and a loop of `period`"""
+    def step(x):
+        x += 1
+        return x if x < offset + period else offset
+    return step
+
+
+def _iterate(state, step, n):
+    for _ in range(n):
+        state = step(state)
+    return state
+
+
+@pytest.mark.parametrize(("offset", "period"), [(0, 1), (0, 7), (3, 1), (5, 4), (17, 32)])
+def test_brent(offset, period):
+    assert brent(0, _rho(offset, period)) == Cycle(offset, period)
+
+
+@pytest.mark.parametrize(("offset", "period"), [(0, 1), (0, 7), (3, 1), (5, 4), (17, 32)])
+def test_find_cycle(offset, period):
+    cycle, state = find_cycle(0, _rho(offset, period))
+    assert cycle == Cycle(offset, period)
+    assert state == offset
+
+
+def test_cycle_key():
+    # states differ, keys repeat
+    step = lambda s: (s[0] + 1, (s[1] + 1) % 3)
+    assert brent((0, 0), step, key=lambda s: s[1]) == Cycle(0, 3)
+    assert find_cycle((0, 0), step, key=lambda s: s[1])[0] == Cycle(0, 3)
+
+
+def test_find_cycle_big_int_keys():
+    # 1 and 2**61 have the same hash
+    states = [1, 1 << 61, 1 << 122, 1]
+    cycle, _ = find_cycle(0, lambda i: (i + 1) % 3, key=states.__getitem__)
+    assert cycle == Cycle(0, 3)
+
+
+def test_cycle_index():
+    cycle = Cycle(5, 4)
+    assert [cycle.index(n) for n in (0, 4, 5, 8, 9, 10, 1_000_000_001)] == [0, 4, 5, 8, 5, 6, 5]
+
+
+@pytest.mark.parametrize("n", [0, 1, 4, 5, 6, 9, 10, 37, 10**12])
+def test_nth_state(n):
+    step = _rho(5, 4)
+    expected = _iterate(0, step, Cycle(5, 4).index(n))
+    assert nth_state(0, step, n) == expected
+
+
+def test_nth_state_negative():
+    with pytest.raises(ValueError):
+        nth_state(0, _rho(1, 1), -1)
@@ -0,0 +1,441 @@
+import itertools
+import random
+
+import pytest
+
+from ..graph import BucketQueue
+from ..graph import condensation
+from ..graph import Cut
+from ..graph import DisjointSet
+from ..graph import dominated_counts
+from ..graph import dominator_tree
+from ..graph import junction_graph
+from ..graph import karger_stein
+from ..graph import longest_path
+from ..graph import min_st_cut
+from ..graph import reachable_sets
+from ..graph import reachable_union
+from ..graph import shortest_path
+from ..graph import StateEncoder
+from ..graph import stoer_wagner
+from ..graph import strongly_connected_components
+from ..parser import FrozenGrid
+from ..parser import Point
+
+
+def test_state_encoder_roundtrip():
+    encoder = StateEncoder(10, 4, 11)
+    assert encoder.size == 440
+
+    states = {encoder.encode(a, b, c) for a in range(10) for b in range(4) for c in range(11)}
+    assert states == set(range(440))
+    assert encoder.decode(encoder.encode(7, 2, 9)) == (7, 2, 9)
+
+
+@pytest.mark.parametrize("values", [(10, 0, 0), (0, -1, 0), (0, 0)])
+def test_state_encoder_invalid_values(values):
+    with pytest.raises(ValueError):
+        StateEncoder(10, 4, 11).encode(*values)
+
+
+def test_state_encoder_invalid_sizes():
+    with pytest.raises(ValueError):
+        StateEncoder(10, 0)
+
+
+GRAPH = {
+    0: [(1, 7), (2, 9), (5, 14)],
+    1: [(0, 7), (2, 10), (3, 15)],
+    2: [(0, 9), (1, 10), (3, 11), (5, 2)],
+    3: [(1, 15), (2, 11), (4, 6)],
+    4: [(3, 6), (5, 9)],
+    5: [(0, 14), (2, 2), (4, 9)],
+    6: [],
+}
+
+
+@pytest.mark.parametrize("size", [None, len(GRAPH)])
+@pytest.mark.parametrize(("goal", "expected"), [(0, 0), (3, 20), (4, 20), (5, 11)])
+def test_shortest_path(size, goal, expected):
+    assert shortest_path([0], GRAPH.__getitem__, goal.__eq__, size=size) == expected
+
+
+def test_shortest_path_multiple_starts():
+    assert shortest_path([0, 4], GRAPH.__getitem__, (3).__eq__) == 6
+
+
+def test_shortest_path_unreachable():
+    with pytest.raises(ValueError):
+        shortest_path([0], GRAPH.__getitem__, (6).__eq__)
+
+
+def test_shortest_path_astar_grid():
+    # 5x5 open grid, states are y * 5 + x
+    def neighbors(state: int):
+        y, x = divmod(state, 5)
+        for dy, dx in ((0, 1), (1, 0), (0, -1), (-1, 0)):
+            if 0 <= y + dy < 5 and 0 <= x + dx < 5:
+                yield (y + dy) * 5 + x + dx, 1
+
+    def heuristic(state: int) -> int:
+        y, x = divmod(state, 5)
+        return 4 - y + 4 - x
+
+    assert shortest_path([0], neighbors, (24).__eq__, heuristic=heuristic) == 8
+
+
+def test_bucket_queue_pops_in_priority_order():
+    queue: BucketQueue[str] = BucketQueue(max_step=3)
+    queue.push(5, "c")
+    queue.push(5, "d")
+    queue.push(7, "e")
+    queue.push(6, "f")
+    assert len(queue) == 4
+
+    popped = []
+    while queue:
+        popped.append(queue.pop())
+        if popped[-1] == (5, "d"):
+            queue.push(8, "g")
+
+    assert [p for p, _ in popped] == [5, 5, 6, 7, 8]
+    assert {item for _, item in popped} == set("cdefg")
+
+
+def test_bucket_queue_rejects_out_of_range_priority():
+    queue: BucketQueue[str] = BucketQueue(max_step=3)
+    queue.push(5, "a")
+    with pytest.raises(ValueError):
+        queue.push(9, "b")
+    with pytest.raises(ValueError):
+        queue.push(4, "b")
+
+
+def test_bucket_queue_pop_empty():
+    with pytest.raises(IndexError):
+        BucketQueue(max_step=1).pop()
+
+
+@pytest.mark.parametrize(("goal", "expected"), [(0, 0), (3, 20), (4, 20), (5, 11)])
+def test_shortest_path_buckets(goal, expected):
+    assert shortest_path([0], GRAPH.__getitem__, goal.__eq__, max_weight=15) == expected
+
+
+MAZE = """\
+#.#####
+#.....#
+#.###.#
+#.....#
+#####.#
+"""
+
+
+def test_junction_graph():
+    grid = FrozenGrid.from_str(MAZE)
+    start, end = Point(1, 0), Point(5, 4)
+    graph = junction_graph(grid, lambda c: c != "#", keep=(start, end))
+
+    assert graph.nodes == (start, Point(1, 1), Point(5, 3), end)
+    assert graph.edges == (
+        ((1, 1),),
+        ((0, 1), (2, 6), (2, 6)),
+        ((1, 6), (1, 6), (3, 1)),
+        ((2, 1),),
+    )
+    assert graph.index(end) == 3
+    assert len(graph) == 4
+
+
+def test_junction_graph_drops_loops():
+    grid = FrozenGrid.from_str("#.###\n#...#\n#.#.#\n#...#\n#####\n")
+    graph = junction_graph(grid, lambda c: c != "#", keep=(Point(1, 0),))
+
+    assert graph.nodes == (Point(1, 0), Point(1, 1))
+    assert graph.edges == (((1, 1),), ((0, 1),))
+
+
+def test_longest_path_maze():
+    grid = FrozenGrid.from_str(MAZE)
+    start, end = Point(1, 0), Point(5, 4)
+    graph = junction_graph(grid, lambda c: c != "#", keep=(start, end))
+
+    assert longest_path(graph.edges, graph.index(start), graph.index(end)) == 8
+
+
+def _brute_force_longest(edges, start, end):
+    best = -1
+    nodes = [n for n in range(len(edges)) if n not in (start, end)]
+    weights = {}
+    for node, node_edges in enumerate(edges):
+        for n, weight in node_edges:
+            weights[node, n] = max(weight, weights.get((node, n), 0))
+
+    for k in range(len(nodes) + 1):
+        for middle in itertools.permutations(nodes, k):
+            path = (start, *middle, end)
+            if all(pair in weights for pair in itertools.pairwise(path)):
+                best = max(best, sum(weights[pair] for pair in itertools.pairwise(path)))
+    return best
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_longest_path_matches_brute_force(seed):
+    rng = random.Random(seed)
+    size = rng.randint(2, 7)
+    edges: list[list[tuple[int, int]]] = [[] for _ in range(size)]
+    for a, b in itertools.combinations(range(size), 2):
+        if rng.random() < 0.5:
+            weight = rng.randint(1, 9)
+            edges[a].append((b, weight))
+            edges[b].append((a, weight))
+
+    expected = _brute_force_longest(edges, 0, size - 1)
+    if expected < 0:
+        with pytest.raises(ValueError):
+            longest_path(edges, 0, size - 1)
+    else:
+        assert longest_path(edges, 0, size - 1) == expected
+
+
+def test_longest_path_jobs():
+    # 4x4 grid graph with varying weights
+    edges: list[list[tuple[int, int]]] = [[] for _ in range(16)]
+    for node in range(16):
+        for n in (node + 1 if node % 4 < 3 else None, node + 4 if node < 12 else None):
+            if n is not None:
+                edges[node].append((n, node + n))
+                edges[n].append((node, node + n))
+
+    assert longest_path(edges, 0, 15, jobs=2) == longest_path(edges, 0, 15)
+
+
+def test_longest_path_start_is_end():
+    assert longest_path([[(1, 5)], [(0, 5)]], 0, 0) == 0
+
+
+def test_longest_path_invalid_jobs():
+    with pytest.raises(ValueError):
+        longest_path([[]], 0, 0, jobs=0)
+
+
+def _undirected(size, weighted_pairs):
+    edges: list[list[tuple[int, int]]] = [[] for _ in range(size)]
+    for a, b, weight in weighted_pairs:
+        edges[a].append((b, weight))
+        edges[b].append((a, weight))
+    return edges
+
+
+# two 4-cliques joined by edges 1-4 (weight 2) and 3-6 (weight 1)
+BARBELL = _undirected(8, [
+    *((a, b, 3) for a, b in itertools.combinations(range(4), 2)),
+    *((a, b, 3) for a, b in itertools.combinations(range(4, 8), 2)),
+    (1, 4, 2),
+    (3, 6, 1),
+])
+BARBELL_CUT = Cut(3, frozenset(range(4)))
+
+
+def _normalize(cut, size):
+    """the side containing node 0"""
+    side = cut.side if 0 in cut.side else frozenset(range(size)) - cut.side
+    return Cut(cut.weight, side)
+
+
+def test_min_st_cut():
+    assert min_st_cut(BARBELL, 0, 7) == BARBELL_CUT
+    assert min_st_cut(BARBELL, 0, 1).weight == 3 * 3
+
+
+def test_min_st_cut_disconnected():
+    assert min_st_cut(_undirected(3, [(0, 1, 1)]), 0, 2) == Cut(0, frozenset({0, 1}))
+
+
+def test_min_st_cut_same_node():
+    with pytest.raises(ValueError):
+        min_st_cut(BARBELL, 2, 2)
+
+
+def test_stoer_wagner():
+    assert _normalize(stoer_wagner(BARBELL), 8) == BARBELL_CUT
+
+
+def test_stoer_wagner_disconnected():
+    cut = stoer_wagner(_undirected(4, [(0, 1, 5), (2, 3, 5)]))
+    assert _normalize(cut, 4) == Cut(0, frozenset({0, 1}))
+
+
+def test_stoer_wagner_too_small():
+    with pytest.raises(ValueError):
+        stoer_wagner([[]])
+
+
+def test_karger_stein():
+    rng = random.Random(0)
+    cut = min((karger_stein(BARBELL, rng=rng) for _ in range(10)), key=lambda c: c.weight)
+    assert _normalize(cut, 8) == BARBELL_CUT
+
+
+def test_karger_stein_contracts():
+    rng = random.Random(0)
+    # two dense random clusters of 60 nodes joined by 2 edges
+    pairs = [
+        (a + offset, b + offset, 1)
+        for offset in (0, 60)
+        for a, b in itertools.combinations(range(60), 2)
+        if rng.random() < 0.3
+    ]
+    edges = _undirected(120, [*pairs, (0, 60, 1), (1, 61, 1)])
+
+    cut = min((karger_stein(edges, rng=rng) for _ in range(3)), key=lambda c: c.weight)
+    assert _normalize(cut, 120) == Cut(2, frozenset(range(60)))
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_min_cuts_agree(seed):
+    rng = random.Random(seed)
+    size = rng.randint(2, 60)
+    # random spanning tree plus extra edges, so the graph is connected
+    pairs = [(rng.randrange(n), n, rng.randint(1, 5)) for n in range(1, size)]
+    pairs += [
+        (a, b, rng.randint(1, 5))
+        for _ in range(size)
+        if (a := rng.randrange(size)) != (b := rng.randrange(size))
+    ]
+    edges = _undirected(size, pairs)
+
+    cut = stoer_wagner(edges)
+    assert cut.weight == min(min_st_cut(edges, 0, t).weight for t in range(1, size))
+    assert cut.weight == sum(
+        weight for a, b, weight in pairs if (a in cut.side) != (b in cut.side)
+    )
+    assert karger_stein(edges, rng=rng).weight >= cut.weight
+
+
+def test_disjoint_set():
+    sets = DisjointSet(6)
+    assert len(sets) == 6
+    assert sets.components == 6
+
+    assert sets.union(0, 1)
+    assert sets.union(2, 3)
+    assert sets.union(1, 3)
+    assert not sets.union(0, 2)
+
+    assert sets.connected(0, 3)
+    assert not sets.connected(0, 4)
+    assert sets.size(2) == 4
+    assert sets.size(5) == 1
+    assert sets.components == 3
+    assert sets.find(0) == sets.find(1) == sets.find(2) == sets.find(3)
+
+
+def test_disjoint_set_reset():
+    sets = DisjointSet(4)
+    sets.union(0, 1)
+    sets.union(2, 3)
+    sets.reset()
+
+    assert sets.components == 4
+    assert not sets.connected(0, 1)
+    assert [sets.size(x) for x in range(4)] == [1, 1, 1, 1]
+
+
+def test_disjoint_set_invalid_size():
+    with pytest.raises(ValueError):
+        DisjointSet(-1)
+
+
+SCC_GRAPH = [[1], [2, 3], [0], [4], [3, 5], [], [5, 0]]
+
+
+def test_strongly_connected_components():
+    components = strongly_connected_components(SCC_GRAPH)
+    assert [sorted(c) for c in components] == [[5], [3, 4], [0, 1, 2], [6]]
+
+
+def test_strongly_connected_components_deep_chain():
+    # deeper than the recursion limit
+    size = 10_000
+    chain = [[n + 1] for n in range(size - 1)] + [[0]]
+    assert [len(c) for c in strongly_connected_components(chain)] == [size]
+
+    chain[-1] = []
+    assert strongly_connected_components(chain) == [[n] for n in reversed(range(size))]
+
+
+def test_condensation():
+    dag = condensation(SCC_GRAPH)
+    assert len(dag) == 4
+    assert dag.component == [2, 2, 2, 1, 1, 0, 3]
+    assert dag.successors == [[], [0], [1], [0, 2]]
+
+
+def _reachable_naive(successors, node):
+    seen = {node}
+    stack = [node]
+    while stack:
+        for n in successors[stack.pop()]:
+            if n not in seen:
+                seen.add(n)
+                stack.append(n)
+    return seen
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_reachable_sets(seed):
+    rng = random.Random(seed)
+    size = rng.randint(1, 40)
+    successors = [
+        [rng.randrange(size) for _ in range(rng.randint(0, 2))] for _ in range(size)
+    ]
+
+    sets = reachable_sets(successors)
+    for node in range(size):
+        expected = _reachable_naive(successors, node)
+        assert sets[node] == sum(1 << n for n in expected)
+
+    dag = condensation(successors)
+    assert all(s < c for c, dag_successors in enumerate(dag.successors) for s in dag_successors)
+
+
+def test_reachable_union():
+    values = [1, 2, 4, 8, 16, 32, 64]
+    assert reachable_union(SCC_GRAPH, values) == [63, 63, 63, 56, 56, 32, 127]
+
+
+# 0 and 1 on the ground, 2 on both, 3 on 2, 4 on 3 and 1, 5 on 4
+STACK = [[], [], [0, 1], [2], [1, 3], [4]]
+
+
+def test_dominator_tree():
+    assert dominator_tree(STACK) == [-1, -1, -1, 2, -1, 4]
+
+
+def test_dominated_counts():
+    assert dominated_counts(STACK) == [0, 0, 1, 0, 1, 0]
+
+
+def test_dominator_tree_not_topological():
+    with pytest.raises(ValueError):
+        dominator_tree([[1], []])
+
+
+def _falling_naive(predecessors, removed):
+    fallen = {removed}
+    for node, node_predecessors in enumerate(predecessors):
+        if node_predecessors and all(p in fallen for p in node_predecessors):
+            fallen.add(node)
+    return len(fallen) - 1
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_dominated_counts_matches_naive(seed):
+    rng = random.Random(seed)
+    predecessors = [
+        sorted(rng.sample(range(node), rng.randint(0 if node < 3 else 1, min(node, 3))))
+        for node in range(rng.randint(1, 200))
+    ]
+
+    counts = dominated_counts(predecessors)
+    assert counts == [_falling_naive(predecessors, node) for node in range(len(predecessors))]
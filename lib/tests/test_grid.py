@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+
+from ..grid import ArrayGrid
+from ..parser import FrozenGrid
+from ..parser import Point
+
+
+GRID = ((1, 2), (3, 4), (5, 6))
+
+
+def test_is_hashable():
+    assert len({ArrayGrid(GRID), ArrayGrid(GRID)}) == 1
+
+
+def test_is_read_only():
+    g = ArrayGrid(np.array(GRID))
+    with pytest.raises(ValueError):
+        g.array[0, 0] = 10
+
+
+def test_requires_2d():
+    with pytest.raises(ValueError):
+        ArrayGrid([1, 2, 3])
+
+
+def test_len():
+    g = ArrayGrid(GRID)
+    assert len(g) == 3
+    assert g.row_len() == 3
+    assert g.col_len() == 2
+
+
+def test_getitem():
+    g = ArrayGrid(GRID)
+    assert g[1, 2] == 6
+    assert tuple(g[2]) == (5, 6)
+
+
+def test_iter_rows_and_cols():
+    g = ArrayGrid(GRID)
+    assert [tuple(r) for r in g.iter_rows()] == [(1, 2), (3, 4), (5, 6)]
+    assert [tuple(r) for r in g.iter_rev_rows()] == [(5, 6), (3, 4), (1, 2)]
+    assert [tuple(c) for c in g.iter_cols()] == [(1, 3, 5), (2, 4, 6)]
+    assert [tuple(c) for c in g.iter_rev_cols()] == [(2, 4, 6), (1, 3, 5)]
+
+
+def test_enum_values():
+    g = ArrayGrid(GRID)
+    assert list(g.enum_values()) == [
+        (Point(0, 0), 1),
+        (Point(1, 0), 2),
+        (Point(0, 1), 3),
+        (Point(1, 1), 4),
+        (Point(0, 2), 5),
+        (Point(1, 2), 6),
+    ]
+
+
+@pytest.mark.parametrize("turns", range(-4, 5))
+def test_rotate_matches_frozen_grid(turns):
+    expected = FrozenGrid(GRID).rotate(turns)
+    assert ArrayGrid(GRID).rotate(turns) == ArrayGrid.from_iter(expected)
+
+
+def test_transforms_match_frozen_grid():
+    fg = FrozenGrid(GRID)
+    ag = ArrayGrid(GRID)
+    assert ag.transpose() == ArrayGrid.from_iter(fg.transpose())
+    assert ag.hreflect() == ArrayGrid.from_iter(fg.hreflect())
+    assert ag.vreflect() == ArrayGrid.from_iter(fg.vreflect())
+
+
+def test_from_str():
+    g = ArrayGrid.from_str("#.S\n..#\n")
+    assert g.row_len() == 2
+    assert g.col_len() == 3
+    assert g[2, 0] == "S"
+    assert repr(g) == "#.S\n..#"
+
+
+def test_from_str_with_parser():
+    g = ArrayGrid.from_str("123\n456\n", int)
+    assert g == ArrayGrid(((1, 2, 3), (4, 5, 6)))
+
+
+def test_from_str_ragged():
+    with pytest.raises(ValueError):
+        ArrayGrid.from_str("123\n45\n")
+
+
+def test_from_str_leading_newline():
+    with pytest.raises(ValueError):
+        ArrayGrid.from_str("\n123\n456\n")
+
+
+def test_find():
+    g = ArrayGrid.from_str("#.S\n..S\n")
+    assert g.find("S") == Point(2, 0)
+    assert g.find_all("S") == [Point(2, 0), Point(2, 1)]
+    with pytest.raises(ValueError):
+        g.find("X")
@@ -0,0 +1,84 @@
+from unittest.mock import patch
+
+import pytest
+
+from .._helpers import DayPart
+from .._helpers import HandledError
+from .._history import append_record
+from .._history import compare
+from .._history import get_commit
+from .._history import get_python_version
+from .._history import iter_records
+from .._history import Record
+
+
+def _record(dp: DayPart, samples: list[int], *, dirty: bool = False) -> Record:
+    return Record(
+        day=dp.day,
+        part=dp.part,
+        commit=get_commit(),
+        dirty=dirty,
+        python=get_python_version(),
+        samples=samples,
+    )
+
+
+def test_iter_records_missing_file(tmp_path):
+    assert list(iter_records(tmp_path / "history.jsonl")) == []
+
+
+def test_append_and_iter_records(tmp_path):
+    path = tmp_path / "history.jsonl"
+    records = [_record(DayPart(1, 1), [1, 2, 3]), _record(DayPart(1, 2), [4])]
+    for record in records:
+        append_record(record, path)
+
+    assert list(iter_records(path)) == records
+
+
+def test_compare_without_baseline(tmp_path):
+    comparison = compare(DayPart(1, 1), [10], "HEAD", path=tmp_path / "history.jsonl")
+
+    assert comparison.baseline is None
+    assert comparison.change is None
+    assert not comparison.regressed
+
+
+@pytest.mark.parametrize(
+    ("samples", "regressed"),
+    [([100, 105, 110], False), ([120, 125, 130], True)],
+)
+def test_compare_detects_regression(tmp_path, samples, regressed):
+    path = tmp_path / "history.jsonl"
+    append_record(_record(DayPart(1, 1), [90, 100, 110]), path)
+    # records of other day/parts or from a dirty tree are ignored
+    append_record(_record(DayPart(1, 2), [1, 1, 1]), path)
+    append_record(_record(DayPart(1, 1), [1, 1, 1], dirty=True), path)
+
+    comparison = compare(DayPart(1, 1), samples, "HEAD", threshold=0.1, path=path)
+
+    assert comparison.baseline == 100
+    assert comparison.regressed is regressed
+
+
+def test_create_with_known_git_state():
+    with patch("subprocess.run", side_effect=AssertionError("git was run")):
+        record = Record.create(DayPart(1, 1), [1, 2], commit="abc", dirty=True)
+
+    assert (record.commit, record.dirty) == ("abc", True)
+
+
+def test_compare_with_known_commit(tmp_path):
+    path = tmp_path / "history.jsonl"
+    append_record(_record(DayPart(1, 1), [90, 100, 110]), path)
+    commit = get_commit()
+
+    with patch("subprocess.run", side_effect=AssertionError("git was run")):
+        comparison = compare(DayPart(1, 1), [100], "HEAD", path=path, commit=commit)
+
+    assert comparison.baseline == 100
+
+
+def test_get_commit_invalid_ref():
+    with pytest.raises(HandledError):
+        get_commit("not-a-valid-ref")
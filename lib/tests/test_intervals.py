@@ -0,0 +1,220 @@
+import itertools
+import random
+
+import pytest
+
+from ..intervals import Box
+from ..intervals import DecisionTable
+from ..intervals import disjoint_union
+from ..intervals import IntervalSet
+from ..intervals import PiecewiseMap
+from ..intervals import Rule
+
+
+def _members(interval_set):
+    return {x for start, stop in interval_set for x in range(start, stop)}
+
+
+def _random_set(rng):
+    intervals = []
+    for _ in range(rng.randint(0, 5)):
+        start = rng.randint(-20, 20)
+        intervals.append((start, start + rng.randint(0, 8)))
+    return IntervalSet(intervals)
+
+
+def test_interval_set_normalizes():
+    s = IntervalSet([(5, 8), (0, 2), (2, 3), (7, 10), (12, 12)])
+    assert s.intervals == ((0, 3), (5, 10))
+    assert len(s) == 2
+    assert s.size == 8
+    assert (s.min(), s.max()) == (0, 9)
+
+
+def test_interval_set_contains():
+    s = IntervalSet([(0, 3), (5, 10)])
+    assert [x for x in range(-1, 12) if x in s] == [0, 1, 2, 5, 6, 7, 8, 9]
+
+
+def test_interval_set_empty():
+    s = IntervalSet()
+    assert not s
+    assert s.size == 0
+    with pytest.raises(ValueError):
+        s.min()
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_interval_set_operations(seed):
+    rng = random.Random(seed)
+    a, b = _random_set(rng), _random_set(rng)
+
+    assert _members(a | b) == _members(a) | _members(b)
+    assert _members(a & b) == _members(a) & _members(b)
+    assert _members(a - b) == _members(a) - _members(b)
+    assert _members(a.shift(7)) == {x + 7 for x in _members(a)}
+    # results stay normalized
+    for result in (a | b, a & b, a - b):
+        assert result == IntervalSet(result.intervals)
+
+
+def test_piecewise_map():
+    m = PiecewiseMap([(98, 100, -48), (50, 98, 2)])
+    assert [m(x) for x in (0, 49, 50, 97, 98, 99, 100)] == [0, 49, 52, 99, 50, 51, 100]
+    assert m.pieces == [(50, 98, 2), (98, 100, -48)]
+
+
+def test_piecewise_map_overlap():
+    with pytest.raises(ValueError):
+        PiecewiseMap([(0, 10, 1), (5, 15, 2)])
+
+
+def test_piecewise_map_drops_redundant_breaks():
+    assert PiecewiseMap([(0, 5, 1), (5, 10, 1), (20, 30, 0)]) == PiecewiseMap([(0, 10, 1)])
+
+
+def _random_map(rng):
+    pieces = []
+    start = rng.randint(-30, 0)
+    for _ in range(rng.randint(0, 4)):
+        stop = start + rng.randint(1, 10)
+        pieces.append((start, stop, rng.randint(-15, 15)))
+        start = stop + rng.randint(0, 5)
+    return PiecewiseMap(pieces)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_piecewise_map_then(seed):
+    rng = random.Random(seed)
+    f, g, h = _random_map(rng), _random_map(rng), _random_map(rng)
+    composed = f.then(g) >> h
+
+    assert all(composed(x) == h(g(f(x))) for x in range(-80, 80))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_piecewise_map_image(seed):
+    rng = random.Random(seed)
+    m, s = _random_map(rng), _random_set(rng)
+
+    assert _members(m.image(s)) == {m(x) for x in _members(s)}
+
+
+def _points(box):
+    return set(itertools.product(*(range(start, stop) for start, stop in box.bounds)))
+
+
+def _random_box(rng, dims=3):
+    bounds = []
+    for _ in range(dims):
+        start = rng.randint(0, 6)
+        bounds.append((start, start + rng.randint(0, 5)))
+    return Box(bounds)
+
+
+def test_box():
+    box = Box([(0, 4), (10, 12)])
+    assert box.volume == 8
+    assert len(box) == 2
+    assert (3, 11) in box
+    assert (4, 11) not in box
+    assert not Box([(0, 4), (3, 3)])
+    assert Box([(0, 4), (3, 3)]) == Box([(5, 1), (0, 1)])
+
+
+def test_box_split():
+    below, above = Box([(0, 4), (10, 12)]).split(1, 11)
+    assert below == Box([(0, 4), (10, 11)])
+    assert above == Box([(0, 4), (11, 12)])
+
+    below, above = Box([(0, 4)]).split(0, 10)
+    assert below == Box([(0, 4)])
+    assert not above
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_box_operations(seed):
+    rng = random.Random(seed)
+    a, b = _random_box(rng), _random_box(rng)
+
+    assert _points(a & b) == _points(a) & _points(b)
+    pieces = a.difference(b)
+    assert set().union(*map(_points, pieces)) == _points(a) - _points(b)
+    assert sum(piece.volume for piece in pieces) == len(_points(a) - _points(b))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_disjoint_union(seed):
+    rng = random.Random(seed)
+    boxes = [_random_box(rng) for _ in range(4)]
+    disjoint = disjoint_union(boxes)
+
+    expected = set().union(*map(_points, boxes))
+    assert set().union(*map(_points, disjoint)) == expected
+    assert sum(box.volume for box in disjoint) == len(expected)
+
+
+WORKFLOWS: dict[str, tuple[list[Rule], str]] = {
+    "in": ([(0, "<", 5, "low"), (1, ">", 7, "A")], "R"),
+    "low": ([(1, "<", 3, "R")], "alias"),
+    "alias": ([], "A"),
+}
+
+
+def _expected_outcome(point):
+    x, y = point
+    if x < 5:
+        return "R" if y < 3 else "A"
+    return "A" if y > 7 else "R"
+
+
+def test_decision_table_evaluate():
+    table = DecisionTable.compile(WORKFLOWS, "in")
+    assert len(table) == 3
+    assert sorted(table.outcomes) == ["A", "R"]
+    for point in itertools.product(range(10), repeat=2):
+        assert table.evaluate(point) == _expected_outcome(point)
+
+
+def test_decision_table_to_function():
+    evaluate = DecisionTable.compile(WORKFLOWS, "in").to_function()
+    for point in itertools.product(range(10), repeat=2):
+        assert evaluate(point) == _expected_outcome(point)
+
+
+def test_decision_table_to_function_long_chain():
+    # a single chain longer than what is inlined into one function
+    workflows: dict[str, tuple[list[Rule], str]] = {
+        f"w{i}": ([(0, "<", i, "A")], f"w{i + 1}") for i in range(300)
+    }
+    table = DecisionTable.compile(workflows, "w0")
+    evaluate = table.to_function()
+    for x in range(0, 310, 7):
+        assert evaluate((x,)) == table.evaluate((x,))
+
+
+def test_decision_table_to_function_outcome_root():
+    assert DecisionTable.compile({"in": ([], "A")}, "in").to_function()((1, 2)) == "A"
+
+
+def test_decision_table_classify():
+    table = DecisionTable.compile(WORKFLOWS, "in")
+    points = list(itertools.product(range(10), repeat=2))
+    outcomes = [table.outcomes[k] for k in table.classify(points)]
+    assert outcomes == [_expected_outcome(point) for point in points]
+
+
+def test_decision_table_partition():
+    table = DecisionTable.compile(WORKFLOWS, "in")
+    partitions = table.partition(Box([(0, 10), (0, 10)]))
+
+    for outcome, boxes in partitions.items():
+        points = [p for box in boxes for p in _points(box)]
+        assert len(points) == len(set(points))
+        assert all(_expected_outcome(p) == outcome for p in points)
+    assert sum(box.volume for boxes in partitions.values() for box in boxes) == 100
+
+
+def test_decision_table_loop():
+    with pytest.raises(ValueError):
+        DecisionTable.compile({"a": ([], "b"), "b": ([], "a")}, "a")
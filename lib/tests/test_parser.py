@@ -1,10 +1,19 @@
+import numpy as np
 import pytest
 
+from ..parser import BitBoard
 from ..parser import collect_block_lines
 from ..parser import collect_block_statements
 from ..parser import collect_lines
+from ..parser import DOWN
+from ..parser import FlatGrid
 from ..parser import FrozenGrid
+from ..parser import LEFT
+from ..parser import NEIGHBORS4
+from ..parser import NEIGHBORS8
 from ..parser import Point
+from ..parser import RIGHT
+from ..parser import UP
 
 
 def test_collect_lines():
@@ -272,3 +281,129 @@ def test_hreflect():
     56        65
     """
     assert g.hreflect() == FrozenGrid(((2, 1), (4, 3), (6, 5)))
+
+
+def test_flat_grid_from_str():
+    g = FlatGrid.from_str("ab\ncd\nef\n", sentinel="#")
+    assert g.cells == b"#####ab##cd##ef#####"
+    assert g.width == 4
+    assert g.height == 5
+    assert g.row_len() == 3
+    assert g.col_len() == 2
+    assert repr(g) == "ab\ncd\nef"
+
+
+def test_flat_grid_from_str_ragged():
+    with pytest.raises(ValueError):
+        FlatGrid.from_str("abc\nde\n")
+
+
+def test_flat_grid_index_and_point():
+    g = FlatGrid.from_str("ab\ncd\nef\n")
+    for p in (Point(0, 0), Point(1, 0), Point(0, 2), Point(1, 2)):
+        assert g.point(g.index(p)) == p
+    assert g[g.index(Point(1, 1))] == "d"
+
+
+def test_flat_grid_offsets():
+    g = FlatGrid.from_str("abc\ndef\nghi\n", sentinel="#")
+    e = g.find("e")
+    assert [g[e + o] for o in g.offsets4] == ["b", "f", "h", "d"]
+    assert [g[e + o] for o in g.offsets8] == ["b", "c", "f", "i", "h", "g", "d", "a"]
+
+
+def test_flat_grid_border_is_sentinel():
+    g = FlatGrid.from_str("ab\ncd\n", sentinel="#")
+    a = g.find("a")
+    assert all(g.is_sentinel(a + o) for o in (-1, -g.width, -g.width - 1))
+    assert not g.in_bounds(a - 1)
+    assert g.in_bounds(a)
+
+
+def test_flat_grid_iter_indices():
+    g = FlatGrid.from_str("ab\ncd\n")
+    assert "".join(g[i] for i in g.iter_indices()) == "abcd"
+
+
+def test_flat_grid_find_missing():
+    with pytest.raises(ValueError):
+        FlatGrid.from_str("ab\ncd\n").find("x")
+
+
+def test_point_add_unsupported():
+    with pytest.raises(TypeError) as ex:
+        Point(1, 2) + (1, 2, 3)  # type: ignore[operator]
+
+    assert "'Point' and 'tuple'" in str(ex.value)
+
+
+def test_point_scalar_float():
+    assert Point(1, 2) + 0.5 == (1.5, 2.5)  # type: ignore[operator]
+
+
+@pytest.mark.parametrize("other", [[3, 4], np.array([3, 4])], ids=repr)
+def test_point_sequence_operand(other):
+    p = Point(1, 2)
+    assert p + other == Point(4, 6)
+    assert p - other == Point(-2, -2)
+    assert p * other == Point(3, 8)
+    assert Point(7, 9) // other == Point(2, 2)
+    assert Point(7, 9) % other == Point(1, 1)
+    assert type(p + other) is Point
+
+
+@pytest.mark.parametrize("p", [Point(0, 0), Point(-5, 7), Point(123456, -98765)], ids=repr)
+def test_point_pack_roundtrip(p):
+    assert Point.unpack(p.pack()) == p
+
+
+def test_point_pack_is_linear():
+    p, q = Point(-3, 4), Point(7, -9)
+    assert Point.unpack(p.pack() + q.pack()) == p + q
+    assert Point.unpack(p.pack() - q.pack()) == p - q
+
+
+def test_neighbor_constants():
+    assert set(NEIGHBORS4) == {UP, DOWN, LEFT, RIGHT}
+    assert set(NEIGHBORS8) == set(Point().iter_neighbors())
+
+
+TILT_GRID = """\
+O.#..
+..O.O
+#O...
+"""
+
+
+def test_bit_board():
+    board = BitBoard.from_str(TILT_GRID)
+    rocks = board.mask(TILT_GRID, lambda c: c == "O")
+
+    assert (board.row_len(), board.col_len(), board.stride) == (3, 5, 6)
+    assert board.to_str(rocks) == TILT_GRID.rstrip("\n")
+    assert list(board.points(rocks)) == [Point(0, 0), Point(2, 1), Point(4, 1), Point(1, 2)]
+    assert board.row_counts(rocks) == [1, 2, 1]
+    assert rocks & board.bit(Point(2, 1))
+    assert not rocks & board.bit(Point(3, 1))
+
+
+@pytest.mark.parametrize(
+    ("direction", "expected"),
+    [
+        (UP, "OO#.O\n..O..\n#...."),
+        (DOWN, "..#..\nO....\n#OO.O"),
+        (LEFT, "O.#..\nOO...\n#O..."),
+        (RIGHT, ".O#..\n...OO\n#...O"),
+    ],
+)
+def test_bit_board_tilt(direction, expected):
+    board = BitBoard.from_str(TILT_GRID)
+    rocks = board.mask(TILT_GRID, lambda c: c == "O")
+    assert board.to_str(board.tilt(rocks, direction)) == expected
+
+
+def test_bit_board_invalid():
+    with pytest.raises(ValueError):
+        BitBoard.from_str("")
+    with pytest.raises(ValueError):
+        BitBoard.from_str("..\n...")
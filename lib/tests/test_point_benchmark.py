@@ -0,0 +1,97 @@
+"""
+Microbenchmark of `Point` arithmetic against the previous implementation,
+which funnelled every operation through an exception driven
+`_point_operation` and `NamedTuple.__new__`.
+"""
+import operator
+import timeit
+from collections.abc import Callable
+from collections.abc import Iterator
+from typing import NamedTuple
+
+import pytest
+
+from ..parser import Point
+
+
+FLOOD_SIZE = 60
+
+
+class LegacyPoint(NamedTuple):
+    x: int = 0
+    y: int = 0
+
+    def __add__(self, other: tuple[int, int] | int) -> "LegacyPoint":  # type: ignore[override]
+        return _legacy_point_operation(self, other, operator.add, "+")
+
+    def iter_neighbors(self, diagonals: bool = True) -> Iterator["LegacyPoint"]:
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                if not diagonals and abs(dx) == abs(dy) == 1:
+                    continue
+                if dx == dy == 0:
+                    continue
+                yield self + (dx, dy)
+
+
+def _legacy_point_operation(
+    point: LegacyPoint,
+    other: tuple[int, int] | int,
+    operation: Callable[[int, int], int],
+    symbol: str,
+) -> LegacyPoint:
+    x: int
+    y: int
+    try:
+        x, y = other  # type: ignore
+    except (ValueError, TypeError):
+        x, y = other, other # type: ignore
+
+    try:
+        return LegacyPoint(operation(point.x, x), operation(point.y, y))
+    except TypeError:
+        raise TypeError(
+            f"unsupported operand type(s) for {symbol}:"
+            f" {type(point).__name__!r} and {type(other).__name__!r}"
+        )
+
+
+def _flood(start: Point | LegacyPoint, size: int) -> int:
+    """breadth first flood fill of a size x size square"""
+    seen = {start}
+    edge = [start]
+    while edge:
+        next_edge = []
+        for p in edge:
+            for n in p.iter_neighbors(diagonals=False):
+                if n not in seen and 0 <= n.x < size and 0 <= n.y < size:
+                    seen.add(n)
+                    next_edge.append(n)
+        edge = next_edge
+    return len(seen)
+
+
+def _best_of(f: Callable[[], object], repeat: int = 5) -> float:
+    return min(timeit.repeat(f, number=1, repeat=repeat))
+
+
+def test_flood_matches_legacy():
+    assert _flood(Point(), FLOOD_SIZE) == _flood(LegacyPoint(), FLOOD_SIZE) == FLOOD_SIZE**2
+
+
+@pytest.mark.benchmark
+def test_point_benchmark():
+    def add(cls: type[Point | LegacyPoint]) -> None:
+        p = cls()
+        for _ in range(20_000):
+            p = p + (1, 1)
+
+    timings = {
+        "flood": lambda cls: _flood(cls(), FLOOD_SIZE),
+        "add": add,
+    }
+    print(f"\npoint arithmetic, {FLOOD_SIZE}x{FLOOD_SIZE} flood and 20000 additions:")
+    for name, run in timings.items():
+        legacy = _best_of(lambda: run(LegacyPoint))
+        current = _best_of(lambda: run(Point))
+        print(f"  {name:>5}: legacy = {legacy * 1e3:.1f} ms, current = {current * 1e3:.1f} ms")
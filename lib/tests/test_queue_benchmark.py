@@ -0,0 +1,32 @@
+"""
+Benchmark of the `BucketQueue` frontier against `heapq` for a crucible
+style search (day 17 rules) on the day 17 input.
+"""
+import timeit
+from pathlib import Path
+
+import pytest
+
+from ..crucibles import min_heat_loss
+from ..parser import FlatGrid
+
+
+INPUT_FILE = Path(__file__).resolve().parents[2] / "day17" / "input.txt"
+MIN_STRAIGHT = 4
+MAX_STRAIGHT = 10
+
+
+def _search(s: str, bucket_queue: bool) -> int:
+    grid = FlatGrid.from_str(s, sentinel="#")
+    return min_heat_loss(grid, MIN_STRAIGHT, MAX_STRAIGHT, bucket_queue=bucket_queue)
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(not INPUT_FILE.exists(), reason="day 17 input is not available")
+def test_bucket_queue_vs_heapq_day17():
+    s = INPUT_FILE.read_text()
+    assert _search(s, False) == _search(s, True)
+
+    heap = min(timeit.repeat(lambda: _search(s, False), number=1, repeat=3))
+    buckets = min(timeit.repeat(lambda: _search(s, True), number=1, repeat=3))
+    print(f"\nday 17 frontier: heapq = {heap:.3f}s, buckets = {buckets:.3f}s")
@@ -1,6 +1,29 @@
+import csv
+import io
+import json
+import multiprocessing
+import time
+from collections.abc import Callable
+
 import pytest
 
+from .._helpers import DayPart
+from .._helpers import HandledError
+from .. import _history
+from ..run import _format_bytes
 from ..run import _format_duration
+from ..run import _get_timeout
+from ..run import Cancelled
+from ..run import Finished
+from ..run import load_timeouts
+from ..run import PeakMemory
+from ..run import profile_it
+from ..run import ResultWriter
+from ..run import run_daypart
+from ..run import run_selections
+from ..run import sample_it
+from ..run import Stats
+from ..run import trace_it
 
 
 @pytest.mark.parametrize(
@@ -23,3 +46,292 @@ from ..run import _format_duration
 )
 def test_format_duration(duration_ns: int, expected: str):
     assert _format_duration(duration_ns) == expected
+
+
+@pytest.mark.parametrize("kwargs", [{"count": 0}, {"jobs": 0}, {"jobs": -1}])
+def test_run_selections_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        run_selections([], **kwargs)
+
+
+def test_stats_from_samples():
+    stats = Stats.from_samples([5, 1, 4, 2, 3])
+    assert stats == Stats(count=5, min=1, median=3, mean=3, p95=4, stddev=1)
+
+
+def test_stats_from_single_sample():
+    stats = Stats.from_samples([7])
+    assert stats == Stats(count=1, min=7, median=7, mean=7, p95=7, stddev=0)
+
+
+def test_stats_requires_samples():
+    with pytest.raises(ValueError):
+        Stats.from_samples([])
+
+
+def test_sample_it_count_and_warmup():
+    calls = []
+    result = sample_it(calls.append, "x", count=3, warmup=2)
+
+    assert isinstance(result, Finished)
+    assert len(calls) == 5
+    assert len(result.samples) == 3
+    assert result.duration == sum(result.samples) // 3
+
+
+def test_sample_it_cancelled_during_warmup():
+    def solution(s: str) -> int:
+        raise KeyboardInterrupt
+
+    assert isinstance(sample_it(solution, "x", warmup=1), Cancelled)
+
+
+def test_load_timeouts(tmp_path):
+    path = tmp_path / "timeouts.toml"
+    path.write_text('"17" = 30\n"17/2" = 60.5\n')
+
+    assert load_timeouts(path) == {17: 30, DayPart(17, 2): 60.5}
+
+
+@pytest.mark.parametrize("contents", ['"x" = 1\n', '"17" = -1\n', '"17" = "a"\n', "17 ="])
+def test_load_timeouts_invalid(tmp_path, contents):
+    path = tmp_path / "timeouts.toml"
+    path.write_text(contents)
+
+    with pytest.raises(HandledError):
+        load_timeouts(path)
+
+
+@pytest.mark.parametrize(
+    ("dp", "default", "expected"),
+    [
+        (DayPart(17, 2), None, 60),
+        (DayPart(17, 1), None, 30),
+        (DayPart(16, 2), 5, 5),
+        (DayPart(16, 1), None, None),
+    ],
+)
+def test_get_timeout(dp, default, expected):
+    timeouts = {17: 30, DayPart(17, 2): 60}
+    assert _get_timeout(dp, default, timeouts) == expected
+
+
+def test_profile_it(tmp_path):
+    path = tmp_path / "profile1.prof"
+
+    assert profile_it(len, "abc", path) == 3
+    assert path.exists()
+
+
+@pytest.mark.parametrize(
+    ("nbytes", "expected"),
+    [
+        (0, "0.0 B"),
+        (1_023, "1023.0 B"),
+        (1_024, "1.0 KiB"),
+        (1_536, "1.5 KiB"),
+        (5 * 1024**2, "5.0 MiB"),
+        (3 * 1024**3, "3.0 GiB"),
+        (2048 * 1024**3, "2048.0 GiB"),
+    ],
+)
+def test_format_bytes(nbytes: int, expected: str):
+    assert _format_bytes(nbytes) == expected
+
+
+def test_trace_it():
+    result, peak = trace_it(lambda s: len(s * 100_000), "x")
+
+    assert result == 100_000
+    assert peak >= 100_000
+
+
+def test_result_writer_json():
+    stream = io.StringIO()
+    writer = ResultWriter("json", stream)
+    writer.write(DayPart(1, 2), Finished(42, 3, [2, 3, 4]), True)
+    writer.write(DayPart(2, 1), Cancelled(5, timed_out=True))
+
+    first, second = map(json.loads, stream.getvalue().splitlines())
+    assert first == {
+        "day": 1,
+        "part": 2,
+        "result": "42",
+        "correct": True,
+        "cancelled": False,
+        "timed_out": False,
+        "duration_ns": 3,
+        "samples": 3,
+        "min_ns": 2,
+        "median_ns": 3,
+        "mean_ns": 3,
+        "p95_ns": 3,
+        "stddev_ns": 1,
+        "peak_rss": None,
+        "peak_traced": None,
+    }
+    assert second["cancelled"] is True
+    assert second["timed_out"] is True
+    assert second["result"] is None
+
+
+def test_result_writer_csv():
+    stream = io.StringIO()
+    writer = ResultWriter("csv", stream)
+    writer.write(DayPart(1, 2), Finished(42, 3, [3], PeakMemory(rss=10, traced=5)), True)
+
+    header, row = csv.reader(io.StringIO(stream.getvalue()))
+    assert tuple(header) == ResultWriter.FIELDS
+    assert dict(zip(header, row)) == {
+        **dict.fromkeys(ResultWriter.FIELDS, ""),
+        "day": "1",
+        "part": "2",
+        "result": "42",
+        "correct": "True",
+        "cancelled": "False",
+        "timed_out": "False",
+        "duration_ns": "3",
+        "samples": "1",
+        "min_ns": "3",
+        "median_ns": "3",
+        "mean_ns": "3",
+        "p95_ns": "3",
+        "stddev_ns": "0",
+        "peak_rss": "10",
+        "peak_traced": "5",
+    }
+
+
+def test_result_writer_invalid_format():
+    with pytest.raises(ValueError):
+        ResultWriter("xml", io.StringIO())  # type: ignore[arg-type]
+
+
+# solutions run in forked worker processes see the monkeypatched DayPart
+forked = pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork",
+    reason="stub solutions are only visible to forked processes",
+)
+
+
+def _answer(s: str) -> int:
+    return int(s)
+
+
+def _slow_answer(s: str) -> int:
+    time.sleep(0.2)
+    return int(s)
+
+
+def _sleep(s: str) -> int:
+    time.sleep(10)
+    return int(s)
+
+
+def _fail(s: str) -> int:
+    raise ValueError(f"failed on {s}")
+
+
+type _AddStub = Callable[[DayPart, Callable[[str], object], int, int], None]
+
+
+@pytest.fixture
+def add_stub(rootdir, monkeypatch) -> _AddStub:
+    """
+    register a stub solution for a day/part, with its input and answer, both
+    parts of a day share the input file
+    """
+    solutions: dict[DayPart, Callable[[str], object]] = {}
+    monkeypatch.setattr(DayPart, "load_solution", lambda dp: solutions[dp])
+    monkeypatch.setattr(DayPart, "is_solved", lambda dp: dp.solutionfile.exists())
+
+    def add(dp: DayPart, solution: Callable[[str], object], input: int, answer: int) -> None:
+        dp.outdir.mkdir(exist_ok=True)
+        dp.inputfile.write_text(str(input))
+        dp.solutionfile.write_text(str(answer))
+        solutions[dp] = solution
+
+    return add
+
+
+@forked
+def test_run_selections_jobs(add_stub, capsys):
+    # the first solution finishes last, results are still reported in order
+    add_stub(DayPart(1, 1), _slow_answer, 1, 1)
+    add_stub(DayPart(1, 2), _answer, 1, 2)
+    add_stub(DayPart(2, 1), _answer, 4, 4)
+
+    rtc = run_selections([DayPart(1, 1), DayPart(1, 2), DayPart(2, 1)], jobs=2)
+
+    lines = capsys.readouterr().out.splitlines()
+    assert [line.split()[1] for line in lines] == ["(01/1)", "(01/2)", "(02/1)"]
+    assert [line[-1] for line in lines] == ["✅", "❌", "✅"]
+    assert rtc == 1
+
+
+def test_run_selections_compare_excludes_own_record(add_stub, rootdir, monkeypatch):
+    monkeypatch.setattr(_history, "get_historyfile", lambda: rootdir / _history.HISTORY_FILENAME)
+    monkeypatch.setattr(_history, "get_commit", lambda ref="HEAD": "c0ffee")
+    monkeypatch.setattr(_history, "is_dirty", lambda: False)
+    comparisons: list[_history.Comparison] = []
+    compare = _history.compare
+
+    def spy_compare(*args, **kwargs) -> _history.Comparison:
+        comparisons.append(compare(*args, **kwargs))
+        return comparisons[-1]
+
+    monkeypatch.setattr(_history, "compare", spy_compare)
+    add_stub(DayPart(1, 1), _answer, 1, 1)
+
+    # record and compare against the same commit, twice
+    for _ in range(2):
+        run_selections([DayPart(1, 1)], count=3, record=True, compare="HEAD")
+
+    first, second = comparisons
+    assert first.baseline is None
+    records = list(_history.iter_records())
+    assert len(records) == 2
+    assert second.baseline == records[0].median
+
+
+@forked
+def test_run_daypart_timeout(add_stub):
+    add_stub(DayPart(1, 1), _sleep, 1, 1)
+
+    result = run_daypart(DayPart(1, 1), timeout=0.2)
+
+    assert isinstance(result, Cancelled)
+    assert result.timed_out
+    assert 0.2e9 <= result.duration < 5e9
+
+
+@forked
+def test_run_daypart_in_child(add_stub):
+    add_stub(DayPart(1, 1), _answer, 7, 7)
+
+    result = run_daypart(DayPart(1, 1), count=2, timeout=5)
+
+    assert isinstance(result, Finished)
+    assert result.result == 7
+    assert len(result.samples) == 2
+
+
+@forked
+def test_run_daypart_in_child_raises(add_stub):
+    add_stub(DayPart(1, 1), _fail, 1, 1)
+
+    with pytest.raises(ValueError, match="failed on 1"):
+        run_daypart(DayPart(1, 1), timeout=5)
+
+
+@forked
+def test_run_selections_continues_after_timeout(add_stub, capsys):
+    add_stub(DayPart(1, 1), _sleep, 1, 1)
+    add_stub(DayPart(2, 1), _answer, 2, 2)
+
+    rtc = run_selections([DayPart(1, 1), DayPart(2, 1)], timeout=0.2)
+
+    timed_out, finished = capsys.readouterr().out.splitlines()
+    assert "solution timed out after" in timed_out
+    assert finished.endswith("✅")
+    assert rtc == 1
@@ -0,0 +1,87 @@
+"""
+Throughput of the `DecisionTable` evaluators against interpreting the
+day 19 workflows rule by rule through closures, as day 19 part 1 did, on
+a large random stream of part ratings.
+"""
+import random
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from ..intervals import DecisionTable
+from ..intervals import Rule
+
+
+INPUT_FILE = Path(__file__).resolve().parents[2] / "day19" / "input.txt"
+CATEGORIES = "xmas"
+PARTS = 20_000
+
+type _Interpreted = dict[str, list[tuple[Callable[[tuple[int, ...]], bool], str]]]
+
+
+def _parse(s: str) -> dict[str, tuple[list[Rule], str]]:
+    workflows: dict[str, tuple[list[Rule], str]] = {}
+    for line in s.split("\n\n")[0].splitlines():
+        name, rest = line.split("{")
+        *rules_s, fallback = rest.strip("}").split(",")
+        rules: list[Rule] = []
+        for rule_s in rules_s:
+            cond, _, target = rule_s.partition(":")
+            op = "<" if "<" in cond else ">"
+            rules.append((CATEGORIES.index(cond[0]), op, int(cond[2:]), target))
+        workflows[name] = (rules, fallback)
+    return workflows
+
+
+def _interpreted(workflows: dict[str, tuple[list[Rule], str]]) -> _Interpreted:
+    def condition(dim: int, op: str, value: int) -> Callable[[tuple[int, ...]], bool]:
+        if op == "<":
+            return lambda rating: rating[dim] < value
+        return lambda rating: rating[dim] > value
+
+    return {
+        name: [(condition(dim, op, value), target) for dim, op, value, target in rules]
+        + [(lambda _: True, fallback)]
+        for name, (rules, fallback) in workflows.items()
+    }
+
+
+def _interpret(workflows: _Interpreted, rating: tuple[int, ...]) -> str:
+    w = "in"
+    while w in workflows:
+        w = next(target for condition, target in workflows[w] if condition(rating))
+    return w
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(not INPUT_FILE.exists(), reason="day 19 input is not available")
+def test_decision_table_throughput_day19():
+    workflows = _parse(INPUT_FILE.read_text())
+    table = DecisionTable.compile(workflows, "in")
+    interpreted = _interpreted(workflows)
+    function = table.to_function()
+
+    rng = random.Random(19)
+    ratings = [tuple(rng.randint(1, 4000) for _ in CATEGORIES) for _ in range(PARTS)]
+    array = np.array(ratings)
+
+    expected = [_interpret(interpreted, rating) for rating in ratings]
+    assert [table.evaluate(rating) for rating in ratings] == expected
+    assert list(map(function, ratings)) == expected
+    assert [table.outcomes[k] for k in table.classify(array)] == expected
+
+    timings = {
+        "interpreted": lambda: [_interpret(interpreted, rating) for rating in ratings],
+        "table": lambda: [table.evaluate(rating) for rating in ratings],
+        "compiled": lambda: list(map(function, ratings)),
+        "numpy": lambda: table.classify(array),
+    }
+    print(f"\nday 19 workflows, {PARTS} parts:")
+    for name, run in timings.items():
+        seconds = min(timeit.repeat(run, number=1, repeat=3))
+        print(f"  {name:>11}: {PARTS / seconds:12,.0f} parts/s")
+    compile_seconds = min(timeit.repeat(table.to_function, number=1, repeat=3))
+    print(f"  compiling the function takes {compile_seconds * 1e3:.1f} ms")